@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shared helpers for the benchmark scripts.
+
+The scripts in this directory are not part of the test suite. Run them
+directly, e.g. ``python benchmarks/bench_access.py``.
+"""
+
+import sys
+import timeit
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "src")))
+
+
+def setup(**options):
+    """Configure Django with the given settings and set it up."""
+    import django
+    from django.conf import settings
+
+    settings.configure(**options)
+    django.setup()
+
+
+def bench(label, stmt, number=100000, repeat=5):
+    """
+    Time a callable and print the best time per call.
+
+    Args:
+        label (str): the label to print.
+        stmt (callable): the callable to time.
+        number (int): number of calls per repetition.
+        repeat (int): number of repetitions.
+
+    Returns:
+        float: the best time per call, in seconds.
+    """
+    best = min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+    print("%-50s %10.1f ns" % (label, best * 1e9))
+    return best
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""Compare warm attribute reads through ``__getattr__`` and the instance dict."""
+
+from _common import bench, setup
+
+setup(APP_MY_INT=42)
+
+import appsettings  # noqa: E402
+
+
+class Settings(appsettings.AppSettings):
+    my_int = appsettings.IntegerSetting()
+
+    class Meta:
+        setting_prefix = "app_"
+
+
+class PreviousSettings(appsettings.AppSettings):
+    """Settings reading values the way ``AppSettings.__getattr__`` used to."""
+
+    my_int = appsettings.IntegerSetting()
+
+    def __getattr__(self, item):
+        if item in self.settings.keys():
+            if item in self._cache:
+                return self._cache[item]
+            value = self._cache[item] = self.settings[item].get_value()
+            return value
+        raise AttributeError(item)
+
+    class Meta:
+        setting_prefix = "app_"
+
+
+class Plain(object):
+    my_int = 42
+
+
+def main():
+    previous = PreviousSettings()
+    settings = Settings()
+    plain = Plain()
+    assert previous.my_int == settings.my_int == 42
+
+    bench("__getattr__ path (previous behavior)", lambda: previous.my_int)
+    bench("instance __dict__ path", lambda: settings.my_int)
+    bench("plain attribute (reference)", lambda: plain.my_int)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""Compare reading a raw value from layered backends through the merged index and by probing each backend."""
+
+from _common import bench, setup
+
+setup(APP_OTHER=1)
+
+import appsettings  # noqa: E402
+
+LAYERS = [
+    appsettings.DictBackend(dict(("APP_%d_%d" % (layer, index), index) for index in range(100))) for layer in range(4)
+]
+LAYERS.append(appsettings.DictBackend({"APP_WORKERS": 4}))
+LAYERS.insert(0, appsettings.DjangoBackend())
+
+
+class Settings(appsettings.AppSettings):
+    workers = appsettings.IntegerSetting()
+
+    class Meta:
+        setting_prefix = "app_"
+        backends = LAYERS
+
+
+setting = Settings.settings["workers"]
+
+
+def probe():
+    for backend in LAYERS:
+        try:
+            return backend.get("APP_WORKERS")
+        except KeyError:
+            pass
+    raise AttributeError("APP_WORKERS")
+
+
+def with_index():
+    return setting.raw_value
+
+
+def main():
+    assert probe() == with_index() == 4
+    bench("probe each backend in turn", probe)
+    bench("merged index", with_index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+"""Compare sequential and thread-pool checks of settings with I/O-bound validators."""
+
+import time
+
+from _common import bench, setup
+
+setup(**dict(("SETTING_%d" % index, index) for index in range(20)))
+
+import appsettings  # noqa: E402
+
+
+def slow_validator(value):
+    # Stands for a validator waiting on I/O, e.g. a DNS lookup.
+    time.sleep(0.005)
+
+
+attrs = dict(
+    ("setting_%d" % index, appsettings.IntegerSetting(default=index, validators=[slow_validator]))
+    for index in range(20)
+)
+Settings = type("Settings", (appsettings.AppSettings,), attrs)
+
+
+def main():
+    bench("check(force=True) sequential", lambda: Settings.check(force=True), number=5, repeat=3)
+    for workers in (2, 4, 8):
+        label = "check(workers=%d, force=True)" % workers
+        bench(label, lambda: Settings.check(workers=workers, force=True), number=5, repeat=3)
+    bench("check() already checked values", lambda: Settings.check(), number=5, repeat=3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""Compare reading a JSON environment variable with and without the parsed value being remembered."""
+
+import json
+import os
+
+from _common import bench, setup
+
+os.environ["APP_OPTIONS"] = json.dumps(dict(("KEY_%d" % index, index) for index in range(100)))
+setup()
+
+import appsettings  # noqa: E402
+
+
+class Settings(appsettings.AppSettings):
+    options = appsettings.DictSetting()
+
+    class Meta:
+        setting_prefix = "app_"
+        environ = True
+
+
+setting = Settings.settings["options"]
+
+
+def parse_every_time():
+    return setting.parse(os.environ["APP_OPTIONS"])
+
+
+def read_raw_value():
+    return setting.raw_value
+
+
+def main():
+    assert parse_every_time() == read_raw_value()
+    bench("parse the environment variable on each read", parse_every_time, number=20000)
+    bench("read the remembered parsed value", read_raw_value, number=20000)
+
+
+if __name__ == "__main__":
+    main()
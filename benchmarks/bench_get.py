@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the first read of one leaf of a wide nested setting, through the whole value and with get()."""
+
+from _common import bench, setup
+
+WIDTH = 50
+
+setup(
+    APP_CACHE=dict(
+        ("BACKEND_%d" % index, {"TIMEOUT": index, "LOCATION": "django.core.validators.MaxLengthValidator"})
+        for index in range(WIDTH)
+    )
+)
+
+import appsettings  # noqa: E402
+
+
+def backend_setting():
+    return appsettings.NestedSetting(
+        settings=dict(timeout=appsettings.IntegerSetting(), location=appsettings.ObjectSetting())
+    )
+
+
+class Settings(appsettings.AppSettings):
+    cache = appsettings.NestedSetting(
+        settings=dict(("backend_%d" % index, backend_setting()) for index in range(WIDTH))
+    )
+
+    class Meta:
+        setting_prefix = "app_"
+
+
+def whole_value():
+    return Settings().cache["backend_7"]["timeout"]
+
+
+def with_get():
+    return Settings().get("cache.backend_7.timeout")
+
+
+def main():
+    assert whole_value() == with_get() == 7
+    bench("first read through the whole nested value", whole_value, number=2000)
+    bench("first read with get()", with_get, number=2000)
+    settings = Settings()
+    settings.get("cache.backend_7.timeout")
+    bench("cached read with get()", lambda: settings.get("cache.backend_7.timeout"))
+
+
+if __name__ == "__main__":
+    main()
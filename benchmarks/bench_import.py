@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""Compare resolutions of an object path, with and without the import cache."""
+
+import importlib
+
+from _common import bench, setup
+
+setup()
+
+import appsettings  # noqa: E402
+from appsettings.imports import import_object  # noqa: E402
+
+PATH = "django.core.validators.MaxLengthValidator.compare"
+
+
+def previous_transform(path):
+    """Resolve the path the way ``ObjectSetting.transform`` used to."""
+    obj_parent_modules = path.split(".")
+    objects = [obj_parent_modules.pop(-1)]
+    while True:
+        try:
+            parent_module = importlib.import_module(".".join(obj_parent_modules))
+            break
+        except ImportError:
+            objects.insert(0, obj_parent_modules.pop(-1))
+    current_object = parent_module
+    for obj in objects:
+        current_object = getattr(current_object, obj)
+    return current_object
+
+
+def uncached():
+    appsettings.clear_import_cache()
+    return import_object(PATH)
+
+
+def main():
+    assert previous_transform(PATH) is import_object(PATH)
+    bench("previous resolution", lambda: previous_transform(PATH), number=10000)
+    bench("import_object, cleared cache", uncached, number=10000)
+    bench("import_object, cached", lambda: import_object(PATH))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure the import time of the package with ``python -X importtime``.
+
+Each statement runs in a fresh interpreter, and the cumulative import time
+of every top-level module imported by the statement is summed, minus the
+time of the modules imported by the interpreter startup itself.
+"""
+
+import os
+import subprocess
+import sys
+from os.path import abspath, dirname, join
+
+SRC = abspath(join(dirname(__file__), "..", "src"))
+
+STATEMENTS = (
+    ("import appsettings", "import appsettings"),
+    ("import appsettings; appsettings.AppSettings", "import appsettings; appsettings.AppSettings"),
+    ("import appsettings.settings (declaring settings)", "import appsettings.settings"),
+)
+
+
+def import_time(statement, repeat=5):
+    """
+    Return the best cumulative import time of a statement.
+
+    Args:
+        statement (str): the Python statement to run.
+        repeat (int): number of fresh interpreters to run.
+
+    Returns:
+        float: the best time, in microseconds.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC)
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement], env=env, stderr=subprocess.PIPE, check=True
+        )
+        total = 0
+        for line in process.stderr.decode().splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            # Top-level imports are not indented.
+            if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+                total += int(cumulative)
+        best = total if best is None else min(best, total)
+    return best
+
+
+def main():
+    startup = import_time("pass")
+    for label, statement in STATEMENTS:
+        print("%-50s %10.1f us" % (label, import_time(statement) - startup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the first read of an object setting pointing to a heavy module: eager, lazy and prefetched."""
+
+import subprocess
+import sys
+from os.path import dirname
+
+CODE = """
+from timeit import default_timer
+from _common import setup
+
+setup(APP_BACKEND="django.contrib.admin.sites.AdminSite")
+
+import appsettings
+
+
+class Settings(appsettings.AppSettings):
+    backend = appsettings.ObjectSetting(lazy=%r)
+
+    class Meta:
+        setting_prefix = "app_"
+
+
+if %r:
+    from appsettings.prefetch import prefetch_objects
+
+    prefetch_objects().wait()
+
+start = default_timer()
+Settings().backend
+print(default_timer() - start)
+"""
+
+
+def first_read(lazy, prefetch=False, repeat=5):
+    """Return the best duration of the first read of the setting, each in a fresh interpreter."""
+    durations = []
+    for _ in range(repeat):
+        code = CODE % (lazy, prefetch)
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=dirname(__file__) or ".")
+        durations.append(float(output))
+    return min(durations)
+
+
+def main():
+    for lazy in (False, True):
+        print("%-50s %10.1f us" % ("first read, lazy=%s" % lazy, first_read(lazy) * 1e6))
+    print("%-50s %10.1f us" % ("first read after prefetch", first_read(False, prefetch=True) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
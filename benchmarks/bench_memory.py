@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure the memory footprint of settings and validators with tracemalloc.
+
+The "before" objects are built from copies of the previous, unslotted
+classes. The "after" settings are declared, as in an ``AppSettings`` class,
+and checked once. Their interned full name is shared with the name of the
+variable in the project settings, so it is not counted. The validators of
+bounds are shared by the settings with the same bounds: the last cases
+use distinct bounds, which cannot be shared.
+"""
+
+import itertools
+import tracemalloc
+
+from _common import setup
+
+setup(SETTING=5)
+
+from django.core.validators import MaxValueValidator, MinValueValidator  # noqa: E402
+
+import appsettings  # noqa: E402
+
+COUNT = 10000
+
+
+class PreviousSetting(object):
+    """Copy of the previous ``Setting`` state: an instance ``__dict__`` and a list of validators."""
+
+    default_validators = ()
+    checker = None
+
+    def __init__(self, name="", default=None, required=False, prefix="", call_default=True, validators=()):
+        self.name = name
+        self.default = default
+        self.call_default = call_default
+        self.transform_default = False
+        self.required = required
+        self.prefix = prefix
+        self.parent_setting = None
+        self.validators = list(itertools.chain(self.default_validators, validators))
+
+
+class PreviousIntegerSetting(PreviousSetting):
+    """Copy of the previous ``IntegerSetting``."""
+
+    default_validators = (appsettings.TypeValidator(int),)
+
+    def __init__(self, name="", default=0, minimum=None, maximum=None):
+        super(PreviousIntegerSetting, self).__init__(name=name, default=default)
+        if minimum is not None:
+            self.validators.append(MinValueValidator(minimum))
+        if maximum is not None:
+            self.validators.append(MaxValueValidator(maximum))
+
+
+class PreviousValuesTypeValidator(object):
+    """Copy of the previous ``ValuesTypeValidator``."""
+
+    message = "Element %(value)s is not of type %(type)s."
+
+    def __init__(self, value_type, message=None):
+        self.value_type = value_type
+        if message:
+            self.message = message
+
+
+def footprint(factory):
+    """Return the memory allocated per object created by the factory, in bytes."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size / float(COUNT)
+
+
+def declared(setting):
+    """Freeze and check a setting, as done for the settings of ``AppSettings`` classes."""
+    setting._freeze()
+    setting.check()
+    return setting
+
+
+def main():
+    # Distinct bounds, whose validators cannot be shared.
+    bounds = itertools.count(1000000)
+    results = [
+        ("IntegerSetting() (before)", lambda: PreviousIntegerSetting(name="setting")),
+        ("IntegerSetting() (after)", lambda: declared(appsettings.IntegerSetting(name="setting"))),
+        (
+            "IntegerSetting(minimum=0, maximum=10) (before)",
+            lambda: PreviousIntegerSetting(name="setting", minimum=0, maximum=10),
+        ),
+        (
+            "IntegerSetting(minimum=0, maximum=10) (after)",
+            lambda: declared(appsettings.IntegerSetting(name="setting", minimum=0, maximum=10)),
+        ),
+        (
+            "IntegerSetting(minimum=-i, maximum=i) (before)",
+            lambda: PreviousIntegerSetting(name="setting", minimum=-next(bounds), maximum=next(bounds)),
+        ),
+        (
+            "IntegerSetting(minimum=-i, maximum=i) (after)",
+            lambda: declared(appsettings.IntegerSetting(name="setting", minimum=-next(bounds), maximum=next(bounds))),
+        ),
+        ("ValuesTypeValidator (before)", lambda: PreviousValuesTypeValidator(int)),
+        ("ValuesTypeValidator (after)", lambda: appsettings.ValuesTypeValidator(int)),
+    ]
+    for label, factory in results:
+        print("%-50s %10.1f bytes" % (label, footprint(factory)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the first read of one key of a nested setting, eager and lazy."""
+
+from _common import bench, setup
+
+KEYS = ["key_%d" % index for index in range(20)]
+
+setup(APP_NESTED=dict((key.upper(), "django.core.validators.MaxLengthValidator") for key in KEYS))
+
+import appsettings  # noqa: E402
+
+
+def nested_setting(lazy):
+    return appsettings.NestedSetting(lazy=lazy, settings=dict((key, appsettings.ObjectSetting()) for key in KEYS))
+
+
+class Settings(appsettings.AppSettings):
+    nested = nested_setting(False)
+    lazy_nested = nested_setting(True)
+
+    class Meta:
+        setting_prefix = "app_"
+
+
+Settings.lazy_nested.name = "nested"
+
+
+def first_read(name):
+    settings = Settings()
+    return getattr(settings, name)["key_0"]
+
+
+def main():
+    assert first_read("nested") is first_read("lazy_nested")
+    bench("first read of one key, eager", lambda: first_read("nested"), number=10000)
+    bench("first read of one key, lazy", lambda: first_read("lazy_nested"), number=10000)
+
+
+if __name__ == "__main__":
+    main()
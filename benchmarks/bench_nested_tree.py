@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""Compare resolving and checking wide and deep nested settings, with and without handing raw values down."""
+
+from _common import bench, setup
+
+WIDTH = 50
+DEPTH = 8
+
+
+def wide_raw():
+    return dict(("LEAF_%d" % index, index) for index in range(WIDTH))
+
+
+def deep_raw():
+    raw = {"LEAF": 0}
+    for _ in range(DEPTH):
+        raw = {"NODE": raw, "LEAF": 0}
+    return raw
+
+
+setup(WIDE=wide_raw(), DEEP=deep_raw())
+
+import appsettings  # noqa: E402
+
+
+def wide_setting():
+    leaves = dict(("leaf_%d" % index, appsettings.IntegerSetting()) for index in range(WIDTH))
+    return appsettings.NestedSetting(settings=leaves)
+
+
+def deep_setting():
+    setting = appsettings.IntegerSetting(name="leaf")
+    for _ in range(DEPTH):
+        setting = appsettings.NestedSetting(settings=dict(node=setting, leaf=appsettings.IntegerSetting()))
+    return setting
+
+
+class Settings(appsettings.AppSettings):
+    wide = wide_setting()
+    deep = deep_setting()
+
+
+def previous_get_value(setting):
+    """Resolve the setting the way it used to: every subsetting looks its raw value up from the root."""
+    if not isinstance(setting, appsettings.NestedSetting):
+        return setting.get_value()
+    setting.raw_value
+    return dict((key, previous_get_value(subsetting)) for key, subsetting in setting.settings.items())
+
+
+def main():
+    for name in ("wide", "deep"):
+        setting = Settings.settings[name]
+        assert previous_get_value(setting) == setting.get_value()
+        bench("%s get_value, lookups from the root" % name, lambda: previous_get_value(setting), number=2000)
+        bench("%s get_value, raw values handed down" % name, setting.get_value, number=2000)
+        bench("%s check(force=True)" % name, lambda: setting.check(force=True), number=2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""Compare per-element and bulk type checks of large containers."""
+
+import array
+import numbers
+
+from _common import bench, setup
+
+setup()
+
+import appsettings  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SIZES = (10, 1000, 100000, 1000000)
+
+
+def previous_values_type(value, value_type):
+    """Values type check as done before bulk checks."""
+    for element in value:
+        if not isinstance(element, value_type):
+            raise ValueError(element)
+
+
+def previous_dict_values_type(value, value_type):
+    """Dict values type check as done before bulk checks."""
+    for key, element in value.items():
+        if not isinstance(element, value_type):
+            raise ValueError(key)
+
+
+def main():
+    values_validator = appsettings.ValuesTypeValidator(int)
+    integral_validator = appsettings.ValuesTypeValidator(numbers.Integral)
+    dict_validator = appsettings.DictValuesTypeValidator(str)
+    for size in SIZES:
+        number = max(1, 100000 // size)
+        values = list(range(size))
+        table = dict((str(i), str(i)) for i in range(size))
+        integers = array.array("l", values)
+
+        print("%d elements" % size)
+        bench("  list, per element", lambda: previous_values_type(values, int), number=number)
+        bench("  list, bulk", lambda: values_validator(values), number=number)
+        bench(
+            "  list, abstract type, per element",
+            lambda: previous_values_type(values, numbers.Integral),
+            number=number,
+        )
+        bench("  list, abstract type, bulk", lambda: integral_validator(values), number=number)
+        bench("  array.array, bulk", lambda: values_validator(integers), number=number)
+        if numpy is not None:
+            ndarray = numpy.arange(size, dtype=float)
+            float_validator = appsettings.ValuesTypeValidator(float)
+            bench("  numpy float array, bulk", lambda: float_validator(ndarray), number=number)
+        bench("  dict values, per element", lambda: previous_dict_values_type(table, str), number=number)
+        bench("  dict values, bulk", lambda: dict_validator(table), number=number)
+
+
+if __name__ == "__main__":
+    main()
@@ -56,23 +56,20 @@ setup(
         # 'Framework :: Django :: 1.10',
         # 'Framework :: Django :: 1.11',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: Implementation :: PyPy',
         'Topic :: Utilities',
     ],
     keywords=[
         'django', 'app', 'settings',
     ],
-    install_requires=[
-        'six'
-    ],
+    python_requires='>=3.7',
+    install_requires=[],
     extras_require={
-        # eg:
-        #   'rst': ['docutils>=0.11'],
-        #   ':python_version=="2.6"': ['argparse'],
+        'toml': ['tomli; python_version < "3.11"'],
     },
 )
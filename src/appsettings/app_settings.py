@@ -0,0 +1,788 @@
+# -*- coding: utf-8 -*-
+
+"""
+AppSettings module.
+
+This module defines the ``AppSettings`` base class, its metaclass, and the
+functions checking the settings of every ``AppSettings`` subclass.
+"""
+
+import collections
+import contextlib
+import itertools
+import threading
+import weakref
+from contextvars import ContextVar
+from timeit import default_timer
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+
+from . import stats
+from .backends import backend_changed, get_default_backend, layered
+from .settings import Setting, _subsetting_value
+
+
+class _Resolution(object):
+    """
+    A setting value being resolved.
+
+    Threads asking for a setting value which is already being resolved by
+    another thread wait on this object instead of resolving it again.
+    """
+
+    def __init__(self):
+        """Initialization method."""
+        self.thread = threading.current_thread()
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+    def get(self):
+        """
+        Wait for the resolution to finish and return its result.
+
+        Returns:
+            object: the resolved value.
+
+        Raises:
+            Exception: the exception raised during the resolution, if any.
+        """
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class SettingError(collections.namedtuple("SettingError", "app_settings name error")):
+    """
+    An error found while checking a setting.
+
+    Attributes:
+        app_settings (class): the ``AppSettings`` subclass declaring the setting.
+        name (str): the name of the setting variable.
+        error (Exception): the exception raised by the setting check.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return str(self.error)
+
+
+def _get_item(value, keys):
+    """
+    Return the item of a nested value at the given keys.
+
+    Args:
+        value (dict): the nested setting value.
+        keys (tuple): the keys of the subsettings.
+
+    Returns:
+        object: the item.
+
+    Raises:
+        KeyError: if an item is missing.
+    """
+    for key in keys:
+        value = value[key]
+    return value
+
+
+def _has_callable_default(setting):
+    """
+    Return whether a setting or one of its subsettings has a default to call.
+
+    Classes, like the ``dict`` default of dict settings, are not expected to
+    read Django settings and are not considered.
+
+    Args:
+        setting (Setting): the declared setting.
+
+    Returns:
+        bool: whether a default is called to get the value.
+    """
+    for subsetting in itertools.chain((setting,), (chain[-1] for _, _, chain in setting._paths)):
+        default = subsetting.default
+        if subsetting.call_default and callable(default) and not isinstance(default, type):
+            return True
+    return False
+
+
+def _index_settings(_meta):
+    """
+    Index the declared settings by full name and path.
+
+    See ``_Metaclass``. The indexes are computed when the class is created,
+    and again when one of its settings is renamed.
+
+    Args:
+        _meta (Meta): the ``_meta`` attribute of the ``AppSettings`` subclass.
+    """
+    names = {}
+    index = {}
+    paths = {}
+    volatile = []
+    for name, setting in _meta.settings.items():
+        names.setdefault(setting.full_name, []).append(name)
+        index.setdefault(setting.full_name, (name, (), ()))
+        if _has_callable_default(setting):
+            volatile.append(name)
+        setting_paths = paths[name] = []
+        for keys, full_names, chain in setting._paths:
+            entry = (name, tuple(keys.split(".")), chain)
+            for path in ("%s.%s" % (name, keys), "%s.%s" % (setting.full_name, full_names)):
+                if path not in index:
+                    index[path] = entry
+                    setting_paths.append(path)
+    _meta.names = names
+    _meta.index = index
+    _meta.paths = paths
+    _meta.volatile = volatile
+
+
+def _reindex(setting):
+    """
+    Index again the settings of the classes declaring a renamed setting.
+
+    The cached values of the instances of these classes are dropped.
+
+    Args:
+        setting (Setting): the renamed top-level setting.
+    """
+    for cls in _Metaclass.registered_classes():
+        if any(declared is setting for declared in cls._meta.settings.values()):
+            _index_settings(cls._meta)
+            for instance in list(cls._meta.instances):
+                instance.invalidate_cache()
+
+
+class _Snapshot(object):
+    """
+    Base class for immutable snapshots of settings values.
+
+    A subclass with one slot per setting is generated by ``_Metaclass`` for
+    each ``AppSettings`` subclass, see ``AppSettings.snapshot()``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, app_settings):
+        """
+        Initialization method.
+
+        Args:
+            app_settings (AppSettings): the instance to read values from.
+        """
+        for name in self.__slots__:
+            object.__setattr__(self, name, getattr(app_settings, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' object is read-only" % self.__class__.__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("'%s' object is read-only" % self.__class__.__name__)
+
+    def __repr__(self):
+        values = ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__)
+        return "%s(%s)" % (self.__class__.__name__, values)
+
+
+class _Metaclass(type):
+    """
+    ``AppSettings``'s metaclass.
+
+    Each setting object declared in the class will be populated (name, prefix)
+    and moved into the _meta.settings dictionary. A reference to this
+    dictionary will also be added in the class as ``settings``.
+
+    A reverse index from the settings' full names (the names of the Django
+    settings) to the variable names is stored in ``_meta.names``. It is used
+    to invalidate only the affected cache entries when a setting changes.
+
+    The dotted paths to every subsetting of the nested settings are indexed
+    in ``_meta.index``, see ``AppSettings.get()``. Since the values of the
+    subsettings are cached under these paths, they are also listed by
+    variable name in ``_meta.paths``, to be invalidated with the setting.
+
+    The variable names of the settings with a callable default (or with a
+    subsetting having one) are listed in ``_meta.volatile``: the default may
+    read any Django setting, so their values are invalidated on every change.
+
+    Settings may not be declared with the name of an attribute of the class,
+    such as ``get`` or ``check``, or of its instances, such as ``_cache``,
+    since they would be unreachable.
+
+    The class used by ``AppSettings.snapshot()`` is generated here as well,
+    and stored in ``_meta.snapshot_class``. The backends of the ``backends``
+    option are layered in ``_meta.backend``, and set on every setting.
+
+    Every created class is registered in ``_Metaclass.registry`` (as a weak
+    reference, in creation order), and every instance of a class is
+    registered in its ``_meta.instances`` weak set.
+    """
+
+    registry = []
+
+    def __new__(mcs, cls, bases, dct):
+        """
+        New method.
+
+        Args:
+            cls (str): class name.
+            bases (tuple): base classes to inherit from.
+            dct (dict): class attributes.
+
+        Returns:
+            class: the new created class.
+        """
+        super_new = super(_Metaclass, mcs).__new__
+
+        # Also ensure initialization is only performed for subclasses
+        # of AppSettings (excluding AppSettings class itself).
+        parents = [b for b in bases if isinstance(b, _Metaclass)]
+        if not parents:
+            return super_new(mcs, cls, bases, dct)
+
+        new_attr = {}
+        _meta = dct.pop("Meta", type("Meta", (), {"setting_prefix": ""}))()
+        _meta.settings = {}
+        _meta.backend = layered(getattr(_meta, "backends", None))
+        # Settings must not be hidden by the attributes of the class, or of its instances.
+        reserved = {"settings", "_meta", "_cache", "_pending", "_lock", "_overrides", "_overridden"}
+        for parent in parents:
+            for klass in parent.__mro__:
+                reserved.update(vars(klass))
+
+        for name, setting in dct.items():
+            if isinstance(setting, Setting):
+                if name in reserved:
+                    raise ImproperlyConfigured(
+                        "Setting %s.%s clashes with the AppSettings attribute of the same name" % (cls, name)
+                    )
+                _meta.settings[name] = setting
+                # populate name
+                if setting.name == "":
+                    setting.name = name
+                # populate prefix
+                if setting.prefix == "":
+                    setting.prefix = _meta.setting_prefix
+                if getattr(_meta, "environ", False):
+                    setting.environ = True
+                if _meta.backend is not None:
+                    setting.backend = _meta.backend
+                setting._freeze()
+            else:
+                new_attr[name] = setting
+        _index_settings(_meta)
+        _meta.snapshot_class = type(
+            str(cls + "Snapshot"),
+            (_Snapshot,),
+            {"__slots__": tuple(sorted(_meta.settings)), "__module__": dct.get("__module__")},
+        )
+        _meta.instances = weakref.WeakSet()
+        new_attr["_meta"] = _meta
+        new_attr["settings"] = _meta.settings
+
+        new_cls = super_new(mcs, cls, bases, new_attr)
+        mcs.registry.append(weakref.ref(new_cls, mcs.registry.remove))
+        return new_cls
+
+    @classmethod
+    def registered_classes(mcs):
+        """
+        Return the registered classes still alive.
+
+        Returns:
+            list: the ``AppSettings`` subclasses, in creation order.
+        """
+        classes = (ref() for ref in mcs.registry)
+        return [cls for cls in classes if cls is not None]
+
+    def __getattr__(cls, item):
+        """
+        Return a setting object if it is in the ``_meta.settings`` dictionary.
+
+        Args:
+            item (str):
+                the name of the setting variable (not the setting's name).
+
+        Returns:
+            ``Setting``: the setting object.
+
+        Raises:
+            AttributeError if the setting does not exist.
+        """
+        if item in cls._meta.settings.keys():
+            return cls._meta.settings[item]
+        raise AttributeError("'%s' class has no attribute '%s'" % (cls.__name__, item))
+
+
+class AppSettings(metaclass=_Metaclass):
+    """
+    Base class for application settings.
+
+    Only use this class as a parent class for inheritance. If you try to
+    access settings directly in ``AppSettings``, it will raise a
+    RecursionError. Some protections have been added to prevent you from
+    instantiating this very class, or to return immediately when running
+    ``AppSettings.check()``, but trying to access attributes on the class is
+    not yet prevented.
+
+    """
+
+    def __init__(self):
+        """
+        Initialization method.
+
+        The ``invalidate_cache`` method will be connected to the Django
+        ``setting_changed`` signal in this method, with the dispatch UID
+        being the id of this very object (``id(self)``). It is also called
+        when the backend of the class sends the ``backend_changed`` signal.
+        """
+        if self.__class__ == AppSettings:
+            raise RuntimeError("Do not use AppSettings class as itself, " "use it as a base for subclasses")
+        self._cache = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._overrides = ContextVar("appsettings_overrides", default=None)
+        self._overridden = False
+        self._meta.instances.add(self)
+        setting_changed.connect(self.invalidate_cache, dispatch_uid=id(self))
+        backend_changed.connect(self._backend_changed, dispatch_uid=id(self))
+
+    def __getattr__(self, item):
+        """
+        Return a setting value.
+
+        The caching is done here. If the setting exists, and if it's variable
+        name is in the cache dictionary, return the cached value. If there
+        is no cached value, get the setting value with ``setting.get_value()``,
+        cache it, and return it.
+
+        The resolved value is also written into the instance ``__dict__``,
+        so that subsequent reads are plain attribute lookups and do not go
+        through this method at all. ``invalidate_cache`` removes it again.
+
+        Resolution is thread-safe: if several threads ask for the same
+        missing value, only the first one resolves it, the other ones wait
+        for its result. A value resolved while its cache entry was being
+        invalidated is returned to the waiting threads, but not cached.
+
+        Values overridden with ``override()`` in the current context are
+        returned first. Once the instance has been overridden, values are no
+        longer written into the instance ``__dict__``: contexts copied inside
+        ``override()``, like asyncio tasks, keep the overrides after the
+        ``with`` block exits. The same goes when instrumentation
+        is enabled with ``set_stats_sink``, so that every read is recorded.
+
+        Args:
+            item (str):
+                the name of the setting variable (not the setting's name).
+
+        Returns:
+            object: a setting value.
+
+        Raises:
+            AttributeError if the setting does not exist.
+        """
+        if item in self.settings:
+            overrides = self._overrides.get()
+            if overrides and item in overrides:
+                return overrides[item]
+            setting = self.settings[item]
+            return self._get_cached(item, setting.get_value)
+        raise AttributeError("'%s' object has no attribute '%s'" % (repr(self), item))
+
+    def get(self, path):
+        """
+        Return the value of a setting or of a subsetting, given its dotted path.
+
+        The path is made of the setting variable name followed by the keys of
+        the subsettings (``"cache.backends.default.timeout"``), or of the
+        full names of the setting and subsettings, like in the project
+        settings (``"CACHE.BACKENDS.DEFAULT.TIMEOUT"``). The paths are indexed
+        when the class is created, and the value of a subsetting is resolved
+        and cached on its own, without resolving the whole nested setting.
+
+        If the whole nested setting value is already cached, or overridden,
+        the subsetting value is read from it. If an ancestor of the subsetting
+        is missing from the project settings, the whole nested setting value
+        is resolved and the subsetting value read from it.
+
+        Args:
+            path (str): the dotted path of the setting or subsetting.
+
+        Returns:
+            object: the value.
+
+        Raises:
+            AttributeError: if there is no setting at this path.
+            KeyError: if the value of an ancestor of the subsetting has no such key.
+        """
+        if path in self.settings:
+            return getattr(self, path)
+        try:
+            name, keys, chain = self._meta.index[path]
+        except KeyError:
+            raise AttributeError("'%s' object has no setting '%s'" % (repr(self), path)) from None
+        if not keys:
+            return getattr(self, name)
+        overrides = self._overrides.get()
+        if overrides and name in overrides:
+            return _get_item(overrides[name], keys)
+        if stats._sink is None:
+            # Fast path, reading a dict is atomic.
+            try:
+                return self._cache[path]
+            except KeyError:
+                pass
+        with self._lock:
+            cached = name in self._cache
+            if cached:
+                value = self._cache[name]
+        if cached:
+            return _get_item(value, keys)
+        return self._get_cached(path, lambda: self._resolve_path(name, keys, chain))
+
+    def _resolve_path(self, name, keys, chain):
+        """
+        Return the value of a subsetting, handing the raw values of its ancestors down.
+
+        Args:
+            name (str): the name of the setting variable.
+            keys (tuple): the keys of the subsettings.
+            chain (tuple): the subsettings, from the setting child to the subsetting.
+
+        Returns:
+            object: the value.
+        """
+        try:
+            raw = self.settings[name].raw_value
+            for subsetting in chain[:-1]:
+                raw = subsetting._get_raw_value(raw)
+        except (AttributeError, KeyError):
+            return _get_item(getattr(self, name), keys)
+        return _subsetting_value(chain[-1], raw)
+
+    def _get_cached(self, key, get_value):
+        """
+        Return a cached value, or resolve it and cache it.
+
+        See ``__getattr__``: this is where the thread-safe caching and the
+        instrumentation happen. Only values of setting variables are written
+        into the instance ``__dict__``.
+
+        Args:
+            key (str): the cache key, a setting variable name or a dotted path.
+            get_value (callable): the function resolving the value.
+
+        Returns:
+            object: the value.
+        """
+        sink = stats._sink
+        with self._lock:
+            cached = key in self._cache
+            if cached:
+                value = self._cache[key]
+                if sink is None and not self._overridden and key in self.settings:
+                    self.__dict__[key] = value
+            else:
+                resolution = self._pending.get(key)
+                owner = resolution is None
+                if owner:
+                    resolution = self._pending[key] = _Resolution()
+        if sink is not None:
+            sink_key = "%s.%s" % (self.__class__.__name__, key)
+            if cached:
+                sink.hit(sink_key)
+            else:
+                sink.miss(sink_key)
+        if cached:
+            return value
+        if owner:
+            return self._resolve(key, resolution, get_value)
+        if resolution.thread is threading.current_thread():
+            # The value is needed to compute itself, do not wait forever.
+            return get_value()
+        return resolution.get()
+
+    def _resolve(self, key, resolution, get_value):
+        """
+        Resolve a value, cache it and share it with waiting threads.
+
+        The value is not cached if the pending resolution was dropped by
+        ``invalidate_cache`` in the meantime.
+
+        Args:
+            key (str): the cache key, a setting variable name or a dotted path.
+            resolution (_Resolution): the pending resolution.
+            get_value (callable): the function resolving the value.
+
+        Returns:
+            object: the value.
+        """
+        sink = stats._sink
+        try:
+            if sink is None:
+                resolution.value = get_value()
+            else:
+                sink_key = "%s.%s" % (self.__class__.__name__, key)
+                # The transformations of the value are recorded with the same key.
+                token = stats._resolving.set(sink_key)
+                start = default_timer()
+                try:
+                    resolution.value = get_value()
+                finally:
+                    stats._resolving.reset(token)
+                sink.timing("get_value", sink_key, default_timer() - start)
+        except BaseException as error:
+            resolution.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._pending.get(key) is resolution:
+                    del self._pending[key]
+                    if resolution.error is None:
+                        self._cache[key] = resolution.value
+                        if stats._sink is None and not self._overridden and key in self.settings:
+                            self.__dict__[key] = resolution.value
+            resolution.event.set()
+        return resolution.value
+
+    @classmethod
+    def check(cls, workers=None, force=False):
+        """
+        Class method to check every settings.
+
+        Will raise an ``ImproperlyConfigured`` exception with explanation.
+
+        Args:
+            workers (int):
+                the maximum number of threads used to check the settings
+                concurrently. By default, they are checked one after the other.
+                The errors are reported in the same order in both cases.
+            force (bool):
+                whether to validate the values which were already successfully
+                checked and did not change since.
+        """
+        if cls == AppSettings:
+            return None
+
+        errors = _check_settings(cls._settings_items(), workers, force)
+        if errors:
+            raise ImproperlyConfigured("\n".join(str(error) for error in errors))
+
+    @classmethod
+    def _settings_items(cls):
+        """
+        Return the settings to check.
+
+        Returns:
+            list: (class, setting variable name, setting) tuples.
+        """
+        return [(cls, name, setting) for name, setting in cls.settings.items()]
+
+    def preload(self, check=False):
+        """
+        Resolve and cache the values of every setting.
+
+        Call this method in your ``AppConfig.ready()`` to pay for the values
+        resolution (and transformation, like ``ObjectSetting`` imports) at
+        startup instead of on first access.
+
+        Args:
+            check (bool): whether to check the settings first.
+
+        Returns:
+            dict: the time spent resolving each setting value, in seconds,
+            keyed by setting variable name.
+
+        Raises:
+            ImproperlyConfigured: if ``check`` is true and a setting is invalid.
+        """
+        if check:
+            self.check()
+        timings = {}
+        for name in self.settings:
+            start = default_timer()
+            getattr(self, name)
+            timings[name] = default_timer() - start
+        return timings
+
+    @contextlib.contextmanager
+    def override(self, **values):
+        """
+        Override setting values in the current context.
+
+        Use it as a context manager. Overrides are local to the current
+        thread or asyncio task, and can be nested. Unlike Django's
+        ``override_settings``, the cache is left untouched. The given values
+        are returned as is, they are neither transformed nor checked.
+
+        Contexts copied inside the ``with`` block, like asyncio tasks, keep
+        the overrides. Values are then no longer written into the instance
+        ``__dict__``, where they would shadow the overrides.
+
+        Args:
+            values: the values to use, keyed by setting variable name.
+
+        Raises:
+            AttributeError: if a setting does not exist.
+        """
+        for item in values:
+            if item not in self.settings:
+                raise AttributeError("'%s' object has no attribute '%s'" % (repr(self), item))
+        overrides = dict(self._overrides.get() or {})
+        overrides.update(values)
+        token = self._overrides.set(overrides)
+        with self._lock:
+            self._overridden = True
+            for item in self.settings:
+                self.__dict__.pop(item, None)
+        try:
+            yield self
+        finally:
+            self._overrides.reset(token)
+
+    def snapshot(self):
+        """
+        Return an immutable snapshot of every setting value.
+
+        The snapshot attributes are the setting values at the time of the
+        call. Reading them is as fast as reading any slotted attribute, and
+        they are not affected by later cache invalidations.
+
+        Returns:
+            object: the snapshot, with one attribute per setting.
+        """
+        return self._meta.snapshot_class(self)
+
+    def _backend_changed(self, sender, **kwargs):
+        """Invalidate cache when the backend of this class declares a change."""
+        backend = self._meta.backend
+        if backend is None:
+            backend = get_default_backend()
+        if sender is backend:
+            self.invalidate_cache(**kwargs)
+
+    def _drop_instance_values(self):
+        """Drop the resolved values from the instance ``__dict__``, keeping them in the cache."""
+        with self._lock:
+            for item in self.settings:
+                self.__dict__.pop(item, None)
+
+    def invalidate_cache(self, **kwargs):
+        """
+        Invalidate cache. Run when receive ``setting_changed`` signal.
+
+        If the name of the changed Django setting is given (as the
+        ``setting`` keyword argument sent with the signal), only the values
+        of the settings reading this Django setting are dropped, along with
+        the values of the settings with a callable default, which may read
+        any Django setting. Otherwise, the whole cache is invalidated.
+
+        Args:
+            kwargs: the ``setting_changed`` signal arguments.
+        """
+        setting = kwargs.get("setting")
+        with self._lock:
+            if setting is None:
+                items = set(self._cache) | set(self._pending)
+            else:
+                names = itertools.chain(self._meta.names.get(setting, ()), self._meta.volatile)
+                items = []
+                for name in names:
+                    items.append(name)
+                    items.extend(self._meta.paths[name])
+            invalidated = []
+            for item in items:
+                if item in self._cache or item in self._pending:
+                    invalidated.append(item)
+                self._cache.pop(item, None)
+                self._pending.pop(item, None)
+                self.__dict__.pop(item, None)
+        sink = stats._sink
+        if sink is not None:
+            for item in invalidated:
+                sink.invalidation("%s.%s" % (self.__class__.__name__, item))
+
+
+def _check_setting(item, force=False):
+    """
+    Check a setting.
+
+    Args:
+        item (tuple): (class, setting variable name, setting) tuple.
+        force (bool): whether to validate the value even if already checked.
+
+    Returns:
+        SettingError: the error, or None if the setting is valid.
+    """
+    cls, name, setting = item
+    sink = stats._sink
+    start = default_timer()
+    try:
+        # Overrides of check() may not accept the force argument.
+        if force:
+            setting.check(force=True)
+        else:
+            setting.check()
+    # pylama:ignore=W0703
+    except Exception as e:
+        return SettingError(cls, name, e)
+    finally:
+        if sink is not None:
+            sink.timing("check", "%s.%s" % (cls.__name__, name), default_timer() - start)
+    return None
+
+
+def _check_settings(items, workers=None, force=False):
+    """
+    Check settings and collect the errors, optionally in a thread pool.
+
+    Args:
+        items (list): (class, setting variable name, setting) tuples.
+        workers (int): the maximum number of threads, None to check in the current thread.
+        force (bool): whether to validate the values even if already checked.
+
+    Returns:
+        list of SettingError: the errors, in items order.
+    """
+    if workers and len(items) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+            results = list(executor.map(_check_setting, items, itertools.repeat(force)))
+    else:
+        results = [_check_setting(item, force) for item in items]
+    return [error for error in results if error is not None]
+
+
+def check_all(classes=None, workers=None, force=False):
+    """
+    Check the settings of every ``AppSettings`` subclass in one pass.
+
+    Unlike ``AppSettings.check()``, no exception is raised: the errors of
+    all the classes are collected and returned together.
+
+    Args:
+        classes (iterable of classes):
+            the ``AppSettings`` subclasses to check. Defaults to every
+            registered subclass.
+        workers (int):
+            the maximum number of threads used to check the settings
+            concurrently. By default, they are checked one after the other.
+        force (bool):
+            whether to validate the values which were already successfully
+            checked and did not change since.
+
+    Returns:
+        list of SettingError: the errors, ordered by class creation then setting.
+    """
+    if classes is None:
+        classes = _Metaclass.registered_classes()
+    items = []
+    for cls in classes:
+        items.extend(cls._settings_items())
+    return _check_settings(items, workers, force)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""Django application configuration."""
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
+
+
+class AppSettingsConfig(AppConfig):
+    """
+    Application configuration.
+
+    Add ``appsettings`` to your ``INSTALLED_APPS`` to check the settings of
+    every ``AppSettings`` subclass with Django's system checks framework.
+
+    If the ``APPSETTINGS_PREFETCH_OBJECTS`` setting is true, the objects of
+    the object settings of every ``AppSettings`` subclass are also imported
+    in a background thread, once every application is ready.
+
+    Attributes:
+        prefetcher (Prefetcher): the started prefetcher, or None.
+    """
+
+    name = "appsettings"
+    verbose_name = "Application settings"
+    prefetcher = None
+
+    def ready(self):
+        """Register the settings checks and start the prefetch if enabled."""
+        from .checks import check_settings
+
+        checks.register(check_settings)
+        if getattr(settings, "APPSETTINGS_PREFETCH_OBJECTS", False):
+            from .prefetch import prefetch_objects
+
+            self.prefetcher = prefetch_objects()
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+"""
+Backends module.
+
+This module defines the sources the settings read their raw values from.
+By default, settings read ``django.conf.settings``. Other backends can be
+layered by priority, for every ``AppSettings`` class with
+``set_default_backend``, or for one class with the ``backends`` option of
+its ``Meta`` class.
+"""
+
+import abc
+import json
+import os
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import Signal
+
+# Sent by a backend when some of its values changed, with the name of the
+# changed value as ``setting`` argument, or None if any value may have changed.
+backend_changed = Signal()
+
+_default = None
+
+
+def get_default_backend():
+    """
+    Return the backend of the ``AppSettings`` classes without ``backends`` option.
+
+    Returns:
+        Backend: the default backend, or None to read ``django.conf.settings`` directly.
+    """
+    return _default
+
+
+def set_default_backend(backend):
+    """
+    Set the backend of the ``AppSettings`` classes without ``backends`` option.
+
+    Values already cached in ``AppSettings`` instances are kept, so set the
+    default backend before reading the settings.
+
+    Args:
+        backend (Backend or list of Backend):
+            the backend, or the backends by decreasing priority, or None to
+            read ``django.conf.settings`` directly.
+    """
+    global _default
+    _default = layered(backend)
+
+
+def layered(backends):
+    """
+    Return a single backend for the given backends.
+
+    Args:
+        backends (Backend or list of Backend): a backend, or backends by decreasing priority.
+
+    Returns:
+        Backend: the backend itself, a ``LayeredBackend``, or None if None was given.
+    """
+    if backends is None or isinstance(backends, Backend):
+        return backends
+    return LayeredBackend(backends)
+
+
+class Backend(abc.ABC):
+    """
+    Base backend.
+
+    A backend provides raw values by setting full name. The set of the names
+    it provides is computed once, then kept until the backend declares a
+    change with ``changed``. Subclasses must implement ``load_names`` and
+    ``get``, or cannot be instantiated.
+
+    Class attributes:
+        strings (bool):
+            whether the values are strings, to be parsed by the settings
+            (see ``Setting.parse``).
+
+    Attributes:
+        generation (int): the number of changes declared so far.
+    """
+
+    strings = False
+
+    def __init__(self):
+        """Initialization method."""
+        self.generation = 0
+        self._names = None
+        self._lock = threading.Lock()
+
+    @property
+    def names(self):
+        """
+        Property to return the names of the values provided by this backend.
+
+        Returns:
+            frozenset: the names.
+        """
+        names = self._names
+        if names is None:
+            with self._lock:
+                generation = self.generation
+            names = frozenset(self.load_names())
+            with self._lock:
+                if generation == self.generation:
+                    self._names = names
+        return names
+
+    @abc.abstractmethod
+    def load_names(self):
+        """
+        Return the names of the values provided by this backend.
+
+        Returns:
+            iterable: the names.
+        """
+        raise NotImplementedError
+
+    def source(self, name):
+        """
+        Return the backend providing the given name.
+
+        Args:
+            name (str): the full name of the setting.
+
+        Returns:
+            Backend: this very backend.
+
+        Raises:
+            KeyError: if the backend does not provide this name.
+        """
+        if name not in self.names:
+            raise KeyError(name)
+        return self
+
+    @abc.abstractmethod
+    def get(self, name):
+        """
+        Return the value of the given name.
+
+        Args:
+            name (str): the full name of the setting.
+
+        Returns:
+            object: the raw value.
+
+        Raises:
+            KeyError: if the backend does not provide this name.
+        """
+        raise NotImplementedError
+
+    def changed(self, names=None):
+        """
+        Declare that some values of this backend changed.
+
+        The ``backend_changed`` signal is sent for each name, so the
+        ``AppSettings`` instances using this backend only drop the values
+        of the affected settings.
+
+        Args:
+            names (iterable of str): the changed names, or None if any value may have changed.
+        """
+        with self._lock:
+            self.generation += 1
+            self._names = None
+        if names is None:
+            backend_changed.send(sender=self, setting=None)
+        else:
+            for name in names:
+                backend_changed.send(sender=self, setting=name)
+
+
+class DjangoBackend(Backend):
+    """Backend reading ``django.conf.settings``, whose changes are notified by the ``setting_changed`` signal."""
+
+    def __init__(self):
+        """Initialization method."""
+        super(DjangoBackend, self).__init__()
+        setting_changed.connect(self._setting_changed)
+
+    def _setting_changed(self, setting=None, **kwargs):
+        self.changed(None if setting is None else [setting])
+
+    def load_names(self):
+        """Return the names of the Django settings."""
+        return [name for name in dir(settings) if name.isupper()]
+
+    def get(self, name):
+        """Return the value of a Django setting."""
+        try:
+            return getattr(settings, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+
+class EnvironBackend(Backend):
+    """
+    Backend reading the environment variables.
+
+    The values are strings, parsed by the settings. Changes of the
+    environment are not detected: call ``changed`` after changing it.
+    """
+
+    strings = True
+
+    def load_names(self):
+        """Return the names of the environment variables."""
+        return os.environ.keys()
+
+    def get(self, name):
+        """Return the value of an environment variable."""
+        return os.environ[name]
+
+
+class DictBackend(Backend):
+    """Backend reading an in-memory dict, declaring its own changes."""
+
+    def __init__(self, values=None):
+        """
+        Initialization method.
+
+        Args:
+            values (dict): the initial values, by setting full name.
+        """
+        super(DictBackend, self).__init__()
+        self._values = dict(values or {})
+
+    def load_names(self):
+        """Return the names of the values."""
+        return self._values.keys()
+
+    def get(self, name):
+        """Return a value."""
+        return self._values[name]
+
+    def set(self, name, value):
+        """
+        Set a value.
+
+        Args:
+            name (str): the full name of the setting.
+            value (object): the raw value.
+        """
+        self._values[name] = value
+        self.changed([name])
+
+    def delete(self, name):
+        """
+        Delete a value.
+
+        Args:
+            name (str): the full name of the setting.
+
+        Raises:
+            KeyError: if there is no such value.
+        """
+        del self._values[name]
+        self.changed([name])
+
+
+class FileBackend(Backend):
+    """
+    Base backend reading a file of values, by setting full name.
+
+    The file is read on first use. Call ``reload`` to read it again: only
+    the values that differ are declared as changed. Subclasses must
+    implement ``load``.
+    """
+
+    def __init__(self, path):
+        """
+        Initialization method.
+
+        Args:
+            path (str): the path of the file.
+        """
+        super(FileBackend, self).__init__()
+        self.path = path
+        self._values = None
+
+    @abc.abstractmethod
+    def load(self, file):
+        """
+        Return the values read from the file.
+
+        Args:
+            file (file): the file, opened in binary mode.
+
+        Returns:
+            dict: the values.
+        """
+        raise NotImplementedError
+
+    def _read(self):
+        with open(self.path, "rb") as file:
+            values = self.load(file)
+        if not isinstance(values, dict):
+            raise ValueError("%s does not contain a mapping of settings" % self.path)
+        return values
+
+    @property
+    def values(self):
+        """
+        Property to return the values of the file.
+
+        Returns:
+            dict: the values.
+        """
+        values = self._values
+        if values is None:
+            values = self._values = self._read()
+        return values
+
+    def reload(self):
+        """Read the file again, and declare the values that differ as changed."""
+        old, new = self._values, self._read()
+        self._values = new
+        if old is None:
+            self.changed()
+        else:
+            names = [name for name in set(old) | set(new) if old.get(name, self) != new.get(name, self)]
+            if names:
+                self.changed(names)
+
+    def load_names(self):
+        """Return the names of the values."""
+        return self.values.keys()
+
+    def get(self, name):
+        """Return a value."""
+        return self.values[name]
+
+
+class JSONFileBackend(FileBackend):
+    """Backend reading a JSON file."""
+
+    def load(self, file):
+        """Return the values of a JSON file."""
+        return json.load(file)
+
+
+class TOMLFileBackend(FileBackend):
+    """Backend reading a TOML file, with ``tomllib`` (Python >= 3.11) or ``tomli``."""
+
+    def __init__(self, path):
+        """
+        Initialization method.
+
+        Args:
+            path (str): the path of the file.
+
+        Raises:
+            ImportError: if neither ``tomllib`` nor ``tomli`` is available.
+        """
+        # Imported here, so that importing the package does not import a TOML parser.
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError("Reading TOML files requires Python >= 3.11 or the tomli package") from None
+        super(TOMLFileBackend, self).__init__(path)
+        self._tomllib = tomllib
+
+    def load(self, file):
+        """Return the values of a TOML file."""
+        return self._tomllib.load(file)
+
+
+class LayeredBackend(Backend):
+    """
+    Backend reading the first of several backends providing a name.
+
+    The index of the backend providing each name is merged once, then kept
+    until one of the backends declares a change. A change is forwarded,
+    unless the changed name is provided by a backend of higher priority.
+
+    Attributes:
+        backends (tuple of Backend): the backends, by decreasing priority.
+    """
+
+    def __init__(self, backends):
+        """
+        Initialization method.
+
+        Args:
+            backends (list of Backend): the backends, by decreasing priority.
+        """
+        super(LayeredBackend, self).__init__()
+        self.backends = tuple(backends)
+        self._index = None
+        for backend in self.backends:
+            backend_changed.connect(self._backend_changed, sender=backend)
+
+    @property
+    def index(self):
+        """
+        Property to return the backend providing each name.
+
+        Returns:
+            dict: the backends, by name.
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                generation = self.generation
+            index = {}
+            for backend in reversed(self.backends):
+                index.update(dict.fromkeys(backend.names, backend))
+            with self._lock:
+                if generation == self.generation:
+                    self._index = index
+        return index
+
+    def _backend_changed(self, sender, setting=None, **kwargs):
+        index = self._index
+        if setting is not None and index is not None:
+            provider = index.get(setting)
+            if provider is not None and self.backends.index(provider) < self.backends.index(sender):
+                # Still shadowed by a backend of higher priority, nothing changed here.
+                return
+        with self._lock:
+            self._index = None
+        self.changed(None if setting is None else [setting])
+
+    def load_names(self):
+        """Return the names provided by any of the backends."""
+        return self.index.keys()
+
+    def source(self, name):
+        """
+        Return the backend providing the given name.
+
+        Args:
+            name (str): the full name of the setting.
+
+        Returns:
+            Backend: the backend of highest priority providing the name.
+
+        Raises:
+            KeyError: if no backend provides the name.
+        """
+        return self.index[name].source(name)
+
+    def get(self, name):
+        """Return the value of the backend of highest priority providing the name."""
+        return self.index[name].get(name)
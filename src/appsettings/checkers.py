@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checkers module.
+
+This module defines the deprecated type checkers, replaced by validators.
+"""
+
+import warnings
+
+
+# Type checkers ===============================================================
+class TypeChecker(object):
+    """
+    Type checker base class.
+
+    A type checker is a simple class that can be called when instantiated in
+    order to validate an object against some conditions. A simple type checker
+    will only check the type of the object. More complex type checkers can
+    be created by inheriting from this base class.
+    """
+
+    def __init__(self, base_type=None):
+        """
+        Initialization method.
+
+        Args:
+            base_type (type): the type to check against value's type.
+        """
+        warnings.warn("Checkers are deprecated in favor of validators.", DeprecationWarning)
+        self.base_type = base_type
+
+    def __call__(self, name, value):
+        """
+        Call method.
+
+        Args:
+            name (str): the value's name.
+            value (object): the value to check.
+
+        Raises:
+            ValueError: if value is not type base_type.
+        """
+        if not isinstance(value, self.base_type):
+            raise ValueError("%s must be %s, not %s" % (name, self.base_type, value.__class__))
+
+
+class BooleanTypeChecker(TypeChecker):
+    """Boolean type checker."""
+
+    def __init__(self):
+        """Initialization method."""
+        super(BooleanTypeChecker, self).__init__(base_type=bool)
+
+
+class IntegerTypeChecker(TypeChecker):
+    """Integer type checker."""
+
+    def __init__(self, minimum=None, maximum=None):
+        """
+        Initialization method.
+
+        Args:
+            minimum (int): a minimum value (included).
+            maximum (int): a maximum value (included).
+        """
+        super(IntegerTypeChecker, self).__init__(base_type=int)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __call__(self, name, value):
+        """
+        Call method.
+
+        Args:
+            name (str): the value's name.
+            value (int): the value to check.
+
+        Raises:
+            ValueError: if value is not type int.
+            ValueError: if value is less than minimum.
+            ValueError: if value is more than maximum.
+        """
+        super(IntegerTypeChecker, self).__call__(name, value)
+        if isinstance(self.minimum, int):
+            if value < self.minimum:
+                raise ValueError("%s must be greater or equal %s" % (name, self.minimum))
+        if isinstance(self.maximum, int):
+            if value > self.maximum:
+                raise ValueError("%s must be less or equal %s" % (name, self.maximum))
+
+
+class FloatTypeChecker(TypeChecker):
+    """Float type checker."""
+
+    def __init__(self, minimum=None, maximum=None):
+        """
+        Initialization method.
+
+        Args:
+            minimum (float): a minimum value (included).
+            maximum (float): a maximum value (included).
+        """
+        super(FloatTypeChecker, self).__init__(base_type=float)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def __call__(self, name, value):
+        """
+        Call method.
+
+        Args:
+            name (str): the value's name.
+            value (float): the value to check.
+
+        Raises:
+            ValueError: if value is not type float.
+            ValueError: if value is less than minimum.
+            ValueError: if value is more than maximum.
+        """
+        super(FloatTypeChecker, self).__call__(name, value)
+        if isinstance(self.minimum, float):
+            if value < self.minimum:
+                raise ValueError("%s must be greater or equal %s" % (name, self.minimum))
+        if isinstance(self.maximum, float):
+            if value > self.maximum:
+                raise ValueError("%s must be less or equal %s" % (name, self.maximum))
+
+
+# Iterable type checkers ------------------------------------------------------
+class IterableTypeChecker(TypeChecker):
+    """
+    Iterable type checker.
+
+    Inherit from this class to create type checkers that support iterable
+    object checking, with item type, minimum and maximum length, and
+    allowed emptiness.
+    """
+
+    def __init__(self, iter_type, item_type=None, min_length=None, max_length=None, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            iter_type (type): the type of the iterable object.
+            item_type (type): the type of the items inside the object.
+            min_length (int): a minimum length (included).
+            max_length (int): a maximum length (included).
+            empty (bool): whether emptiness is allowed.
+        """
+        super(IterableTypeChecker, self).__init__(base_type=iter_type)
+        self.item_type = item_type
+        self.min_length = min_length
+        self.max_length = max_length
+        self.empty = empty
+
+    def __call__(self, name, value):
+        """
+        Call method.
+
+        Args:
+            name (str): the value's name.
+            value (iterable): the value to check.
+
+        Raises:
+            ValueError: if value is not type iter_type.
+            ValueError: if any item in value is not type item_type.
+            ValueError: if value's length is less than min_length.
+            ValueError: if value's length is more than max_length.
+            ValueError: if value's length is 0 and emptiness is not allowed.
+        """
+        super(IterableTypeChecker, self).__call__(name, value)
+        if isinstance(self.item_type, type):
+            if not all(isinstance(o, self.item_type) for o in value):
+                raise ValueError("All elements of %s must be %s" % (name, self.item_type))
+        if isinstance(self.min_length, int):
+            if len(value) < self.min_length:
+                raise ValueError("%s must be longer than %s (or equal)" % (name, self.min_length))
+        if isinstance(self.max_length, int):
+            if len(value) > self.max_length:
+                raise ValueError("%s must be shorter than %s (or equal)" % (name, self.max_length))
+        if len(value) == 0 and not self.empty:
+            raise ValueError("%s must not be empty" % name)
+
+
+class StringTypeChecker(IterableTypeChecker):
+    """String type checker."""
+
+    def __init__(self, min_length=None, max_length=None, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            min_length (int): minimum length of the string (included).
+            max_length (int): maximum length of the string (included).
+            empty (bool): whether empty string is allowed.
+        """
+        super(StringTypeChecker, self).__init__(
+            iter_type=str, min_length=min_length, max_length=max_length, empty=empty
+        )
+
+
+class ListTypeChecker(IterableTypeChecker):
+    """List type checker."""
+
+    def __init__(self, item_type=None, min_length=None, max_length=None, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            item_type (type): the type of the items inside the list.
+            min_length (int): minimum length of the list (included).
+            max_length (int): maximum length of the list (included).
+            empty (bool): whether empty list is allowed.
+        """
+        super(ListTypeChecker, self).__init__(
+            iter_type=list, item_type=item_type, min_length=min_length, max_length=max_length, empty=empty
+        )
+
+
+class SetTypeChecker(IterableTypeChecker):
+    """Set type checker."""
+
+    def __init__(self, item_type=None, min_length=None, max_length=None, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            item_type (type): the type of the items inside the set.
+            min_length (int): minimum length of the set (included).
+            max_length (int): maximum length of the set (included).
+            empty (bool): whether empty set is allowed.
+        """
+        super(SetTypeChecker, self).__init__(
+            iter_type=set, item_type=item_type, min_length=min_length, max_length=max_length, empty=empty
+        )
+
+
+class TupleTypeChecker(IterableTypeChecker):
+    """Tuple type checker."""
+
+    def __init__(self, item_type=None, min_length=None, max_length=None, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            item_type (type): the type of the items inside the tuple.
+            min_length (int): minimum length of the tuple (included).
+            max_length (int): maximum length of the tuple (included).
+            empty (bool): whether empty tuple is allowed.
+        """
+        super(TupleTypeChecker, self).__init__(
+            iter_type=tuple, item_type=item_type, min_length=min_length, max_length=max_length, empty=empty
+        )
+
+
+# Dict type checkers ----------------------------------------------------------
+class DictTypeChecker(TypeChecker):
+    """Dict type checker."""
+
+    def __init__(self, key_type=None, value_type=None, min_length=None, max_length=None, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            key_type (type): the type of the dict keys.
+            value_type (type): the type of the dict values.
+            min_length (int): minimum length of the dict (included).
+            max_length (int): maximum length of the dict (included).
+            empty (bool): whether empty dict is allowed.
+        """
+        super(DictTypeChecker, self).__init__(base_type=dict)
+        self.key_type = key_type
+        self.value_type = value_type
+        self.min_length = min_length
+        self.max_length = max_length
+        self.empty = empty
+
+    def __call__(self, name, value):
+        """
+        Call method.
+
+        Args:
+            name (str): the value's name.
+            value (dict): the value to check.
+
+        Raises:
+            ValueError: if value is not type dict.
+            ValueError: if any key in value is not type key_type.
+            ValueError: if any value in value is not type value_type.
+            ValueError: if value's length is less than min_length.
+            ValueError: if value's length is more than max_length.
+            ValueError: if value's length is 0 and emptiness is not allowed.
+        """
+        super(DictTypeChecker, self).__call__(name, value)
+        if isinstance(self.key_type, type):
+            if not all(isinstance(o, self.key_type) for o in value.keys()):
+                raise ValueError("All keys of %s must be %s" % (name, self.key_type))
+        if isinstance(self.value_type, type):
+            if not all(isinstance(o, self.value_type) for o in value.values()):
+                raise ValueError("All values of %s must be %s" % (name, self.value_type))
+        if isinstance(self.min_length, int):
+            if len(value) < self.min_length:
+                raise ValueError("%s must be longer than %s (or equal)" % (name, self.min_length))
+        if isinstance(self.max_length, int):
+            if len(value) > self.max_length:
+                raise ValueError("%s must be shorter than %s (or equal)" % (name, self.max_length))
+        if len(value) == 0 and not self.empty:
+            raise ValueError("%s must not be empty" % name)
+
+
+# Complex type checkers -------------------------------------------------------
+class ObjectTypeChecker(StringTypeChecker):
+    """
+    Object type checker.
+
+    Actually only check if the given value is a string.
+
+    TODO: maybe check that value is a valid Python path
+    (https://stackoverflow.com/questions/47537921).
+    TODO: maybe check that the object actually exists
+    (https://stackoverflow.com/questions/14050281).
+    """
+
+    def __init__(self, empty=True):
+        """
+        Initialization method.
+
+        Args:
+            empty (bool):
+        """
+        super(ObjectTypeChecker, self).__init__(empty=empty)
+
+    def __call__(self, name, value):
+        """
+        Call method.
+
+        Args:
+            name (str): the value's name.
+            value (str): the value to check.
+
+        Raises:
+            ValueError: if value is not type str.
+        """
+        super(ObjectTypeChecker, self).__call__(name, value)
+        # TODO: maybe check that value is a valid Python path
+        # https://stackoverflow.com/questions/47537921
+        # TODO: maybe check that the object actually exists
+        # https://stackoverflow.com/questions/14050281
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+"""Django system checks."""
+
+from django.apps import apps
+from django.core import checks
+
+from .app_settings import _Metaclass, check_all
+
+
+def check_settings(app_configs=None, **kwargs):
+    """
+    Check the settings of every ``AppSettings`` subclass.
+
+    Args:
+        app_configs (list): the application configurations to check,
+            all of them if None.
+        kwargs: other arguments passed by the checks framework.
+
+    Returns:
+        list: one ``checks.Error`` per invalid setting.
+    """
+    classes = _Metaclass.registered_classes()
+    if app_configs is not None:
+        classes = [cls for cls in classes if apps.get_containing_app_config(cls.__module__) in app_configs]
+    return [
+        checks.Error(str(error), obj="%s.%s" % (error.app_settings.__name__, error.name), id="appsettings.E001")
+        for error in check_all(classes)
+    ]
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+"""
+Imports module.
+
+This module resolves dotted Python paths into objects for ``ObjectSetting``,
+with a cache shared by every setting of the process.
+"""
+
+import collections
+import functools
+import importlib
+import sys
+import threading
+from importlib.util import find_spec
+
+from django.core.signals import setting_changed
+from django.utils.functional import SimpleLazyObject, empty
+
+from .backends import backend_changed
+
+# Maximum number of resolved paths kept in the cache.
+IMPORT_CACHE_SIZE = 256
+
+_lock = threading.Lock()
+# Module boundaries of the resolved paths, least recently used first. Each
+# entry is a (module name, module, attribute names) tuple: the entry is only
+# valid while that module is still the one in ``sys.modules``.
+_objects = collections.OrderedDict()
+# Paths which are known not to be importable modules.
+_not_modules = set()
+# Copies of ``sys.path`` and ``sys.meta_path`` when ``_not_modules`` was last known to be valid.
+_finders = ([], [])
+
+
+def _clear_not_modules():
+    """Forget every path known not to be a module, see ``clear_import_cache``."""
+    global _finders
+    with _lock:
+        _not_modules.clear()
+        _finders = (list(sys.path), list(sys.meta_path))
+
+
+def _settings_changed(**kwargs):
+    """Forget the paths known not to be modules: changed values may point to modules created since."""
+    _clear_not_modules()
+
+
+setting_changed.connect(_settings_changed, dispatch_uid="appsettings.imports")
+backend_changed.connect(_settings_changed, dispatch_uid="appsettings.imports")
+
+
+def clear_import_cache():
+    """
+    Forget every resolved path and every path known not to be a module.
+
+    Paths known not to be modules are also forgotten when ``sys.path`` or
+    ``sys.meta_path`` change, and once for each ``setting_changed`` or
+    ``backend_changed`` signal. Call this function after creating modules on
+    disk at runtime, as for ``importlib.invalidate_caches``.
+    """
+    with _lock:
+        _objects.clear()
+    _clear_not_modules()
+
+
+def _find_module(module_name):
+    """
+    Return the module of the given name, importing it if it exists.
+
+    Args:
+        module_name (str): the full name of the module.
+
+    Returns:
+        module: the module, or None if there is no such module.
+
+    Raises:
+        ImportError: (or other Exception) if the module exists but fails to import.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    if module_name in _not_modules:
+        return None
+    if find_spec(module_name) is None:
+        with _lock:
+            _not_modules.add(module_name)
+        return None
+    return importlib.import_module(module_name)
+
+
+def _import_module(path):
+    """
+    Import the deepest module of a dotted path.
+
+    The path is walked from its first element. Each next element is
+    imported as a submodule while the current module is a package and
+    ``importlib.util.find_spec`` finds the submodule, even if the package
+    has an attribute of the same name: the longest importable prefix is
+    imported. Nothing is imported only to find out that it does not exist,
+    so errors raised while importing an existing module are propagated
+    untouched.
+
+    Args:
+        path (str): the dot-separated path of the object.
+
+    Returns:
+        tuple: the module name, the module, and the list of attribute names to get from it.
+
+    Raises:
+        ImportError: if not even the first element of the path is a module.
+    """
+    names = path.split(".")
+    module_name = names[0]
+    module = _find_module(module_name)
+    if module is None:
+        raise ImportError("No module named '%s'" % module_name)
+
+    depth = 1
+    while depth < len(names) and hasattr(module, "__path__"):
+        submodule = _find_module(module_name + "." + names[depth])
+        if submodule is None:
+            break
+        module_name, module = module_name + "." + names[depth], submodule
+        depth += 1
+    return module_name, module, names[depth:]
+
+
+def import_object(path):
+    """
+    Return the object at the given dotted path, using the import cache.
+
+    The longest importable prefix of the path is imported (see
+    ``_import_module``), then the remaining names are obtained through
+    ``getattr``. The module of a resolved path is kept in the cache as long
+    as it is unchanged in ``sys.modules``, but the remaining names are
+    obtained again on each call, so rebound attributes (e.g. by
+    ``mock.patch``) are honored. Prefixes which are not modules are
+    remembered, see ``clear_import_cache``. Failed resolutions are not cached.
+
+    Args:
+        path (str): the dot-separated path of the object.
+
+    Returns:
+        object: the imported module or obtained object.
+
+    Raises:
+        ImportError: if not even the first element of the path is a module.
+        AttributeError: if an object of the path does not exist.
+        Exception: any error raised while importing a module of the path.
+    """
+    if sys.path != _finders[0] or sys.meta_path != _finders[1]:
+        _clear_not_modules()
+    with _lock:
+        entry = _objects.pop(path, None)
+        if entry is not None and sys.modules.get(entry[0]) is entry[1]:
+            _objects[path] = entry
+        else:
+            entry = None
+
+    if entry is not None:
+        current_object = entry[1]
+        for attribute in entry[2]:
+            current_object = getattr(current_object, attribute)
+        return current_object
+
+    module_name, module, attributes = _import_module(path)
+    current_object = module
+    for attribute in attributes:
+        current_object = getattr(current_object, attribute)
+
+    with _lock:
+        _objects[path] = (module_name, module, tuple(attributes))
+        while len(_objects) > IMPORT_CACHE_SIZE:
+            _objects.popitem(last=False)
+    return current_object
+
+
+class LazyImport(SimpleLazyObject):
+    """
+    Proxy to the object at a dotted path, resolved on first use.
+
+    The path is resolved with ``import_object`` the first time an attribute
+    of the proxy is accessed, or the proxy is called, compared, etc. Import
+    errors are raised at that time. The proxy forwards ``isinstance``
+    checks, but not ``issubclass`` ones, to the object.
+    """
+
+    def __init__(self, path):
+        """
+        Initialization method.
+
+        Args:
+            path (str): the dot-separated path of the object.
+        """
+        self.__dict__["_path"] = path
+        super(LazyImport, self).__init__(functools.partial(import_object, path))
+
+    def __call__(self, *args, **kwargs):
+        if self._wrapped is empty:
+            self._setup()
+        return self._wrapped(*args, **kwargs)
+
+    def __repr__(self):
+        if self._wrapped is empty:
+            return "<LazyImport: %r>" % self._path
+        return "<LazyImport: %r>" % self._wrapped
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+Prefetch module.
+
+This module imports the objects of every ``ObjectSetting`` in a background
+thread, so that neither the startup nor the first requests pay for it.
+"""
+
+import logging
+import threading
+import time
+
+from django.apps import apps
+
+from .app_settings import SettingError, _Metaclass
+from .imports import import_object
+from .settings import NestedSetting, ObjectSetting
+
+logger = logging.getLogger(__name__)
+
+
+def _object_settings(name, setting):
+    """
+    Yield the object settings of a setting and its subsettings.
+
+    Args:
+        name (str): the setting variable name.
+        setting (Setting): the setting.
+
+    Yields:
+        tuple: the dotted variable name and the object setting.
+    """
+    if isinstance(setting, ObjectSetting):
+        yield name, setting
+    elif isinstance(setting, NestedSetting):
+        for subname, subsetting in setting.settings.items():
+            for item in _object_settings("%s.%s" % (name, subname), subsetting):
+                yield item
+
+
+def _wait_apps_ready(interval=0.1):
+    """
+    Wait until every application is ready.
+
+    Args:
+        interval (float): the polling interval in seconds, for Django versions without ``apps.ready_event``.
+    """
+    ready_event = getattr(apps, "ready_event", None)
+    if ready_event is not None:
+        ready_event.wait()
+    else:
+        while not apps.ready:
+            time.sleep(interval)
+
+
+def _object_path(setting):
+    """
+    Return the path of the object an object setting will import.
+
+    Args:
+        setting (ObjectSetting): the object setting.
+
+    Returns:
+        str: the path, or None if no import is needed.
+    """
+    try:
+        return setting.raw_value
+    except (AttributeError, KeyError):
+        if setting.transform_default:
+            return setting.default_value
+        return None
+
+
+class Prefetcher(object):
+    """
+    Background thread importing the objects of object settings.
+
+    The objects are imported through ``import_object``, so the settings
+    later find them in the import cache.
+
+    Without given classes, the thread waits until every application is
+    ready, then prefetches the object settings of every registered
+    ``AppSettings`` subclass, so the classes defined by applications
+    loaded later are prefetched as well.
+
+    Attributes:
+        errors (list of SettingError): the errors raised so far by the imports.
+    """
+
+    def __init__(self, classes=None):
+        """
+        Initialization method.
+
+        Args:
+            classes (iterable of classes):
+                the ``AppSettings`` subclasses whose object settings to prefetch.
+                Defaults to every subclass registered once the applications are ready.
+        """
+        self.classes = classes
+        self.errors = []
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="appsettings-prefetch")
+        self._thread.daemon = True
+
+    def start(self):
+        """
+        Start the background thread.
+
+        Returns:
+            Prefetcher: this very prefetcher.
+        """
+        self._thread.start()
+        return self
+
+    @property
+    def done(self):
+        """
+        Property to return whether every object was prefetched.
+
+        Returns:
+            bool: True once the background thread is done.
+        """
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Wait for every object to be prefetched.
+
+        Args:
+            timeout (float): the maximum time to wait in seconds, None to wait forever.
+
+        Returns:
+            bool: True if the prefetch is done, False if the timeout expired.
+        """
+        return self._done.wait(timeout)
+
+    def _run(self):
+        try:
+            classes = self.classes
+            if classes is None:
+                _wait_apps_ready()
+                classes = _Metaclass.registered_classes()
+            for cls in classes:
+                for _, name, setting in cls._settings_items():
+                    for full_name, object_setting in _object_settings(name, setting):
+                        self._prefetch(cls, full_name, object_setting)
+        finally:
+            self._done.set()
+
+    def _prefetch(self, cls, name, setting):
+        try:
+            path = _object_path(setting)
+            if path:
+                import_object(path)
+        # pylama:ignore=W0703
+        except Exception as error:
+            self.errors.append(SettingError(cls, name, error))
+            logger.warning("Could not prefetch %s.%s: %s", cls.__name__, name, error)
+
+
+def prefetch_objects(classes=None):
+    """
+    Import the objects of the object settings in a background thread.
+
+    Args:
+        classes (iterable of classes):
+            the ``AppSettings`` subclasses whose object settings to prefetch.
+            Defaults to every subclass registered once the applications are ready.
+
+    Returns:
+        Prefetcher: the started prefetcher.
+    """
+    if classes is not None:
+        classes = list(classes)
+    return Prefetcher(classes).start()
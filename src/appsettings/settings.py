@@ -3,361 +3,123 @@
 """
 Settings module.
 
-This module defines the different type checkers and settings classes.
+This module defines the different settings classes.
 """
 
-import importlib
 import itertools
+import json
+import os
+import sys
 import warnings
+from collections.abc import Mapping
+from timeit import default_timer
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
 from django.core.validators import MaxLengthValidator, MaxValueValidator, MinLengthValidator, MinValueValidator
 
-from .validators import DictKeysTypeValidator, DictValuesTypeValidator, TypeValidator, ValuesTypeValidator
+from . import backends, stats
+from .imports import LazyImport, import_object
+from .validators import DictKeysTypeValidator, DictValuesTypeValidator, IterableValidator, TypeValidator
+
+# Type checkers moved to the checkers module, still importable from here.
+_CHECKERS = frozenset(
+    (
+        "BooleanTypeChecker",
+        "DictTypeChecker",
+        "FloatTypeChecker",
+        "IntegerTypeChecker",
+        "IterableTypeChecker",
+        "ListTypeChecker",
+        "ObjectTypeChecker",
+        "SetTypeChecker",
+        "StringTypeChecker",
+        "TupleTypeChecker",
+        "TypeChecker",
+    )
+)
+
+
+def __getattr__(name):
+    """Return the type checkers, which now live in the ``checkers`` module."""
+    if name in _CHECKERS:
+        from . import checkers
+
+        return getattr(checkers, name)
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
 
 
-# Type checkers ===============================================================
-class TypeChecker(object):
-    """
-    Type checker base class.
-
-    A type checker is a simple class that can be called when instantiated in
-    order to validate an object against some conditions. A simple type checker
-    will only check the type of the object. More complex type checkers can
-    be created by inheriting from this base class.
-    """
-
-    def __init__(self, base_type=None):
-        """
-        Initialization method.
-
-        Args:
-            base_type (type): the type to check against value's type.
-        """
-        warnings.warn("Checkers are deprecated in favor of validators.", DeprecationWarning)
-        self.base_type = base_type
-
-    def __call__(self, name, value):
-        """
-        Call method.
-
-        Args:
-            name (str): the value's name.
-            value (object): the value to check.
-
-        Raises:
-            ValueError: if value is not type base_type.
-        """
-        if not isinstance(value, self.base_type):
-            raise ValueError("%s must be %s, not %s" % (name, self.base_type, value.__class__))
-
-
-class BooleanTypeChecker(TypeChecker):
-    """Boolean type checker."""
-
-    def __init__(self):
-        """Initialization method."""
-        super(BooleanTypeChecker, self).__init__(base_type=bool)
-
-
-class IntegerTypeChecker(TypeChecker):
-    """Integer type checker."""
-
-    def __init__(self, minimum=None, maximum=None):
-        """
-        Initialization method.
-
-        Args:
-            minimum (int): a minimum value (included).
-            maximum (int): a maximum value (included).
-        """
-        super(IntegerTypeChecker, self).__init__(base_type=int)
-        self.minimum = minimum
-        self.maximum = maximum
-
-    def __call__(self, name, value):
-        """
-        Call method.
-
-        Args:
-            name (str): the value's name.
-            value (int): the value to check.
-
-        Raises:
-            ValueError: if value is not type int.
-            ValueError: if value is less than minimum.
-            ValueError: if value is more than maximum.
-        """
-        super(IntegerTypeChecker, self).__call__(name, value)
-        if isinstance(self.minimum, int):
-            if value < self.minimum:
-                raise ValueError("%s must be greater or equal %s" % (name, self.minimum))
-        if isinstance(self.maximum, int):
-            if value > self.maximum:
-                raise ValueError("%s must be less or equal %s" % (name, self.maximum))
-
-
-class FloatTypeChecker(TypeChecker):
-    """Float type checker."""
-
-    def __init__(self, minimum=None, maximum=None):
-        """
-        Initialization method.
-
-        Args:
-            minimum (float): a minimum value (included).
-            maximum (float): a maximum value (included).
-        """
-        super(FloatTypeChecker, self).__init__(base_type=float)
-        self.minimum = minimum
-        self.maximum = maximum
-
-    def __call__(self, name, value):
-        """
-        Call method.
-
-        Args:
-            name (str): the value's name.
-            value (float): the value to check.
-
-        Raises:
-            ValueError: if value is not type float.
-            ValueError: if value is less than minimum.
-            ValueError: if value is more than maximum.
-        """
-        super(FloatTypeChecker, self).__call__(name, value)
-        if isinstance(self.minimum, float):
-            if value < self.minimum:
-                raise ValueError("%s must be greater or equal %s" % (name, self.minimum))
-        if isinstance(self.maximum, float):
-            if value > self.maximum:
-                raise ValueError("%s must be less or equal %s" % (name, self.maximum))
-
-
-# Iterable type checkers ------------------------------------------------------
-class IterableTypeChecker(TypeChecker):
-    """
-    Iterable type checker.
-
-    Inherit from this class to create type checkers that support iterable
-    object checking, with item type, minimum and maximum length, and
-    allowed emptiness.
-    """
-
-    def __init__(self, iter_type, item_type=None, min_length=None, max_length=None, empty=True):
-        """
-        Initialization method.
-
-        Args:
-            iter_type (type): the type of the iterable object.
-            item_type (type): the type of the items inside the object.
-            min_length (int): a minimum length (included).
-            max_length (int): a maximum length (included).
-            empty (bool): whether emptiness is allowed.
-        """
-        super(IterableTypeChecker, self).__init__(base_type=iter_type)
-        self.item_type = item_type
-        self.min_length = min_length
-        self.max_length = max_length
-        self.empty = empty
-
-    def __call__(self, name, value):
-        """
-        Call method.
-
-        Args:
-            name (str): the value's name.
-            value (iterable): the value to check.
-
-        Raises:
-            ValueError: if value is not type iter_type.
-            ValueError: if any item in value is not type item_type.
-            ValueError: if value's length is less than min_length.
-            ValueError: if value's length is more than max_length.
-            ValueError: if value's length is 0 and emptiness is not allowed.
-        """
-        super(IterableTypeChecker, self).__call__(name, value)
-        if isinstance(self.item_type, type):
-            if not all(isinstance(o, self.item_type) for o in value):
-                raise ValueError("All elements of %s must be %s" % (name, self.item_type))
-        if isinstance(self.min_length, int):
-            if len(value) < self.min_length:
-                raise ValueError("%s must be longer than %s (or equal)" % (name, self.min_length))
-        if isinstance(self.max_length, int):
-            if len(value) > self.max_length:
-                raise ValueError("%s must be shorter than %s (or equal)" % (name, self.max_length))
-        if len(value) == 0 and not self.empty:
-            raise ValueError("%s must not be empty" % name)
-
-
-class StringTypeChecker(IterableTypeChecker):
-    """String type checker."""
-
-    def __init__(self, min_length=None, max_length=None, empty=True):
-        """
-        Initialization method.
-
-        Args:
-            min_length (int): minimum length of the string (included).
-            max_length (int): maximum length of the string (included).
-            empty (bool): whether empty string is allowed.
-        """
-        super(StringTypeChecker, self).__init__(
-            iter_type=str, min_length=min_length, max_length=max_length, empty=empty
-        )
-
+# Settings ====================================================================
+# Version of the project settings, incremented on each ``setting_changed``
+# or ``backend_changed`` signal. Validated values which are not hashable are
+# remembered by identity and by this version.
+_settings_version = 0
 
-class ListTypeChecker(IterableTypeChecker):
-    """List type checker."""
 
-    def __init__(self, item_type=None, min_length=None, max_length=None, empty=True):
-        """
-        Initialization method.
+def _bump_settings_version(**kwargs):
+    global _settings_version
+    _settings_version += 1
 
-        Args:
-            item_type (type): the type of the items inside the list.
-            min_length (int): minimum length of the list (included).
-            max_length (int): maximum length of the list (included).
-            empty (bool): whether empty list is allowed.
-        """
-        super(ListTypeChecker, self).__init__(
-            iter_type=list, item_type=item_type, min_length=min_length, max_length=max_length, empty=empty
-        )
 
+setting_changed.connect(_bump_settings_version, dispatch_uid="appsettings.settings_version")
+backends.backend_changed.connect(_bump_settings_version, dispatch_uid="appsettings.settings_version")
 
-class SetTypeChecker(IterableTypeChecker):
-    """Set type checker."""
+# Marker of a parent raw value which was not resolved by the caller.
+_UNRESOLVED = object()
 
-    def __init__(self, item_type=None, min_length=None, max_length=None, empty=True):
-        """
-        Initialization method.
+# Marker of a setting whose value was not successfully checked yet.
+_UNCHECKED = object()
 
-        Args:
-            item_type (type): the type of the items inside the set.
-            min_length (int): minimum length of the set (included).
-            max_length (int): maximum length of the set (included).
-            empty (bool): whether empty set is allowed.
-        """
-        super(SetTypeChecker, self).__init__(
-            iter_type=set, item_type=item_type, min_length=min_length, max_length=max_length, empty=empty
-        )
 
+class _Checked(object):
+    """Value which is not hashable, remembered once checked with the version of the project settings."""
 
-class TupleTypeChecker(IterableTypeChecker):
-    """Tuple type checker."""
+    __slots__ = ("value", "version")
 
-    def __init__(self, item_type=None, min_length=None, max_length=None, empty=True):
+    def __init__(self, value, version):
         """
         Initialization method.
 
         Args:
-            item_type (type): the type of the items inside the tuple.
-            min_length (int): minimum length of the tuple (included).
-            max_length (int): maximum length of the tuple (included).
-            empty (bool): whether empty tuple is allowed.
+            value (object): the checked value.
+            version (int): the version of the project settings.
         """
-        super(TupleTypeChecker, self).__init__(
-            iter_type=tuple, item_type=item_type, min_length=min_length, max_length=max_length, empty=empty
-        )
-
-
-# Dict type checkers ----------------------------------------------------------
-class DictTypeChecker(TypeChecker):
-    """Dict type checker."""
-
-    def __init__(self, key_type=None, value_type=None, min_length=None, max_length=None, empty=True):
-        """
-        Initialization method.
+        self.value = value
+        self.version = version
 
-        Args:
-            key_type (type): the type of the dict keys.
-            value_type (type): the type of the dict values.
-            min_length (int): minimum length of the dict (included).
-            max_length (int): maximum length of the dict (included).
-            empty (bool): whether empty dict is allowed.
-        """
-        super(DictTypeChecker, self).__init__(base_type=dict)
-        self.key_type = key_type
-        self.value_type = value_type
-        self.min_length = min_length
-        self.max_length = max_length
-        self.empty = empty
 
-    def __call__(self, name, value):
-        """
-        Call method.
+# Validators of bounds, by validator class and type of bound, then by bound,
+# shared by the settings with the same bound. Bounds are usually few: past
+# the maximum, the validators of new bounds are not kept.
+_bound_validators = {}
+_BOUND_VALIDATORS_MAX = 256
 
-        Args:
-            name (str): the value's name.
-            value (dict): the value to check.
 
-        Raises:
-            ValueError: if value is not type dict.
-            ValueError: if any key in value is not type key_type.
-            ValueError: if any value in value is not type value_type.
-            ValueError: if value's length is less than min_length.
-            ValueError: if value's length is more than max_length.
-            ValueError: if value's length is 0 and emptiness is not allowed.
-        """
-        super(DictTypeChecker, self).__call__(name, value)
-        if isinstance(self.key_type, type):
-            if not all(isinstance(o, self.key_type) for o in value.keys()):
-                raise ValueError("All keys of %s must be %s" % (name, self.key_type))
-        if isinstance(self.value_type, type):
-            if not all(isinstance(o, self.value_type) for o in value.values()):
-                raise ValueError("All values of %s must be %s" % (name, self.value_type))
-        if isinstance(self.min_length, int):
-            if len(value) < self.min_length:
-                raise ValueError("%s must be longer than %s (or equal)" % (name, self.min_length))
-        if isinstance(self.max_length, int):
-            if len(value) > self.max_length:
-                raise ValueError("%s must be shorter than %s (or equal)" % (name, self.max_length))
-        if len(value) == 0 and not self.empty:
-            raise ValueError("%s must not be empty" % name)
-
-
-# Complex type checkers -------------------------------------------------------
-class ObjectTypeChecker(StringTypeChecker):
+def _bound_validator(validator_class, limit_value):
     """
-    Object type checker.
+    Return a validator of a bound, shared with the settings having the same bound.
 
-    Actually only check if the given value is a string.
+    Args:
+        validator_class (type): a Django ``BaseValidator`` subclass, like ``MinValueValidator``.
+        limit_value (object): the bound.
 
-    TODO: maybe check that value is a valid Python path
-    (https://stackoverflow.com/questions/47537921).
-    TODO: maybe check that the object actually exists
-    (https://stackoverflow.com/questions/14050281).
+    Returns:
+        BaseValidator: the validator.
     """
+    validators = _bound_validators.setdefault((validator_class, type(limit_value)), {})
+    try:
+        validator = validators.get(limit_value)
+    except TypeError:
+        # Not hashable, not shared.
+        return validator_class(limit_value)
+    if validator is None:
+        validator = validator_class(limit_value)
+        if len(validators) < _BOUND_VALIDATORS_MAX:
+            validator = validators.setdefault(limit_value, validator)
+    return validator
 
-    def __init__(self, empty=True):
-        """
-        Initialization method.
 
-        Args:
-            empty (bool):
-        """
-        super(ObjectTypeChecker, self).__init__(empty=empty)
-
-    def __call__(self, name, value):
-        """
-        Call method.
-
-        Args:
-            name (str): the value's name.
-            value (str): the value to check.
-
-        Raises:
-            ValueError: if value is not type str.
-        """
-        super(ObjectTypeChecker, self).__call__(name, value)
-        # TODO: maybe check that value is a valid Python path
-        # https://stackoverflow.com/questions/47537921
-        # TODO: maybe check that the object actually exists
-        # https://stackoverflow.com/questions/14050281
-
-
-# Settings ====================================================================
 class Setting(object):
     """
     Base setting class.
@@ -376,12 +138,56 @@ class Setting(object):
     as default values. The transform_default parameter tells if we should
     transform the default value as well through the transform method.
 
+    Settings use ``__slots__`` to keep their memory footprint small. Once
+    the setting is declared in an ``AppSettings`` class, its validators are
+    stored as a tuple. The rarely set checker, ``environ`` and ``backend``
+    are kept in a single dict, only created when one of them is set.
+
+    The full name of the setting is computed when the name or prefix is set,
+    not on each access, and interned, so it is shared with the name of the
+    variable in the project settings. The subsettings of a declared nested
+    setting store the top-level setting and the keys to look their raw value
+    up, computed once when the top-level setting is declared.
+
+    If the name, prefix or parent of a declared setting is changed, the
+    keys, paths and indexes derived from them are computed again, and the
+    cached values of the ``AppSettings`` instances are dropped.
+
+    Once a declared setting is successfully checked, the checked raw value is
+    remembered and ``check()`` does not validate it again until it changes.
+
     Class attributes:
         default_validators (list of callables): Default set of validators for the setting.
+
+    Attributes:
+        environ (bool):
+            whether the value can be read from an environment variable of the
+            same name, when it is missing from ``django.conf.settings``.
+            Set from ``AppSettings.Meta``, only used on top-level settings.
+        backend (Backend):
+            the backend to read the value from instead of ``django.conf.settings``.
+            Set from ``AppSettings.Meta``, only used on top-level settings.
     """
 
+    __slots__ = (
+        "default",
+        "call_default",
+        "transform_default",
+        "required",
+        "_validators",
+        "_name",
+        "_prefix",
+        "_parent_setting",
+        "_full_name",
+        "_lookup",
+        "_checked",
+        "_extra",
+    )
+
     default_validators = ()
-    checker = None  # Disable checker by default
+
+    # Paths of the subsettings, see NestedSetting.
+    _paths = ()
 
     def __init__(
         self,
@@ -411,19 +217,177 @@ class Setting(object):
                 This argument is deprecated.
             validators (list of callables): list of additional validators to use.
         """
-        self.name = name
         self.default = default
         self.call_default = call_default
         self.transform_default = transform_default
         self.required = required
-        self.prefix = prefix
-        self.parent_setting = None
+        self._name = name
+        self._prefix = prefix
+        self._parent_setting = None
+        self._lookup = None
+        self._update_names()
+        self._checked = _UNCHECKED
+        # Checker, environ, backend and last (string, parsed value) pair read
+        # from the environment or a backend, when set.
+        self._extra = None
 
         if checker is not None:
             warnings.warn("Checkers are deprecated in favor of validators.", DeprecationWarning)
             self.checker = checker
 
-        self.validators = list(itertools.chain(self.default_validators, validators))
+        self._validators = list(itertools.chain(self.default_validators, validators))
+
+    @property
+    def checker(self):
+        """
+        Property to return the type checker (deprecated).
+
+        Returns:
+            callable: the type checker, or None.
+        """
+        return self._get_extra("checker")
+
+    @checker.setter
+    def checker(self, checker):
+        self._set_extra("checker", checker)
+        self._checked = _UNCHECKED
+
+    @property
+    def environ(self):
+        """
+        Property to return whether the value can be read from an environment variable.
+
+        Returns:
+            bool: whether the environment variable of the same name is read when the variable is missing.
+        """
+        return self._get_extra("environ", False)
+
+    @environ.setter
+    def environ(self, environ):
+        self._set_extra("environ", environ)
+
+    @property
+    def backend(self):
+        """
+        Property to return the backend to read the value from.
+
+        Returns:
+            Backend: the backend, or None to read the default backend.
+        """
+        return self._get_extra("backend")
+
+    @backend.setter
+    def backend(self, backend):
+        self._set_extra("backend", backend)
+
+    def _get_extra(self, key, default=None):
+        extra = self._extra
+        if extra is None:
+            return default
+        return extra.get(key, default)
+
+    def _set_extra(self, key, value):
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    @property
+    def validators(self):
+        """
+        Property to return the validators.
+
+        Returns:
+            list of callables: the validators, as a tuple once the setting is declared.
+        """
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators):
+        # A tuple once declared, a list before.
+        if isinstance(self._validators, tuple):
+            self._validators = tuple(validators)
+        else:
+            self._validators = list(validators)
+        self._checked = _UNCHECKED
+
+    def _renamed(self):
+        """
+        Recompute what derives from the names of the setting, once declared.
+
+        Declared settings are indexed by full name and path in their
+        ``AppSettings`` classes, and their subsettings store the keys to look
+        their raw value up. The top-level setting is frozen again, then the
+        classes declaring it index their settings again.
+        """
+        root = self._find_lookup()[0]
+        # Validators are a tuple once declared.
+        if isinstance(root._validators, tuple):
+            from .app_settings import _reindex
+
+            root._freeze()
+            _reindex(root)
+
+    def _freeze(self):
+        """
+        Store the validators as a tuple. Called once the setting is declared.
+
+        If the validators are the default ones, the tuple of the class is shared.
+        """
+        validators = tuple(self.validators)
+        defaults = self.default_validators
+        if (
+            isinstance(defaults, tuple)
+            and len(validators) == len(defaults)
+            and all(validator is default for validator, default in zip(validators, defaults))
+        ):
+            validators = defaults
+        self._validators = validators
+        self._checked = _UNCHECKED
+
+    def _validate(self, value):
+        """
+        Run the checker, ``validate`` and the validators on a value.
+
+        Every step runs in a single pass, without handling exceptions for
+        each validator. Only when a validator fails are the remaining ones
+        run one by one, to collect every error message as ``run_validators``
+        does. ``validate`` is only called if overridden, and an overridden
+        ``run_validators`` is called instead of the validators.
+
+        Args:
+            value (object): the raw value.
+
+        Raises:
+            ValueError: if the value is invalid.
+        """
+        checker = self.checker
+        if checker:
+            checker(self.full_name, value)
+        cls = type(self)
+        validators = self._validators
+        position = -1
+        try:
+            if cls.validate is not Setting.validate:
+                self.validate(value)
+            if cls.run_validators is not Setting.run_validators:
+                self.run_validators(value)
+                return
+            position = 0
+            for validator in validators:
+                validator(value)
+                position += 1
+        except ValidationError as error:
+            # If raised by validate() or run_validators(), the remaining validators are not run.
+            if position >= 0:
+                messages = list(error.messages)
+                remaining = position + 1
+                for validator in validators[remaining:]:
+                    try:
+                        validator(value)
+                    except ValidationError as other_error:
+                        messages.extend(other_error.messages)
+                error = ValidationError(messages)
+            raise ValueError("Setting {} has an invalid value: {}".format(self.full_name, error))
 
     def _reraise_if_required(self, err):
         if self.required:
@@ -432,6 +396,60 @@ class Setting(object):
             else:
                 raise AttributeError("%s setting is required and %s" % (self.full_name, err))
 
+    def _update_names(self):
+        """Compute the full name of the setting."""
+        self._full_name = sys.intern(self._prefix.upper() + self._name.upper())
+
+    @property
+    def name(self):
+        """
+        Property to return the name of the setting.
+
+        Returns:
+            str: the name of the setting.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self._update_names()
+        self._renamed()
+
+    @property
+    def prefix(self):
+        """
+        Property to return the prefix of the setting.
+
+        Returns:
+            str: the prefix of the setting.
+        """
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, prefix):
+        self._prefix = prefix
+        self._update_names()
+        self._renamed()
+
+    @property
+    def parent_setting(self):
+        """
+        Property to return the parent setting, for subsettings of nested settings.
+
+        Returns:
+            Setting: the parent setting, or None.
+        """
+        return self._parent_setting
+
+    @parent_setting.setter
+    def parent_setting(self, parent_setting):
+        self._parent_setting = parent_setting
+        # The lookups are stored again if the new top-level setting is declared.
+        for setting in itertools.chain((self,), (chain[-1] for _, _, chain in self._paths)):
+            setting._lookup = None
+        self._renamed()
+
     @property
     def full_name(self):
         """
@@ -440,7 +458,7 @@ class Setting(object):
         Returns:
             str: upper prefix + upper name.
         """
-        return self.prefix.upper() + self.name.upper()
+        return self._full_name
 
     @property
     def default_value(self):
@@ -462,17 +480,147 @@ class Setting(object):
         """
         Property to return the variable defined in ``django.conf.settings``.
 
+        If a backend is set, on the top-level setting or by default (see
+        ``set_default_backend``), the top-level variable is read from the
+        backend instead. If it is missing and the top-level setting has
+        ``environ`` enabled, it is read from the environment variable of the
+        same name. Strings read from the environment or from a backend
+        of strings are parsed, see ``parse``.
+
         Returns:
             object: the variable defined in ``django.conf.settings``.
 
         Raises:
             AttributeError: if the variable is missing.
             KeyError: if the item is missing from nested setting.
+            ValueError: if the environment variable cannot be parsed.
         """
-        if self.parent_setting is not None:
-            return self.parent_setting.raw_value[self.full_name]
+        lookup = self._lookup
+        if lookup is None:
+            root, keys = self._find_lookup()
         else:
-            return getattr(settings, self.full_name)
+            root, keys = lookup
+        extra = root._extra
+        backend = None if extra is None else extra.get("backend")
+        if backend is None:
+            backend = backends._default
+        try:
+            if backend is None:
+                value = getattr(settings, root._full_name)
+            else:
+                value = root._get_backend_value(backend)
+        except AttributeError:
+            string = os.environ.get(root._full_name) if root.environ else None
+            if string is None:
+                raise
+            value = root._parse_string(string, "Environment variable")
+        for key in keys:
+            value = value[key]
+        return value
+
+    def _find_lookup(self):
+        """
+        Return the top-level setting and the keys to look the raw value up.
+
+        For declared subsettings, they are computed once by the top-level
+        nested setting and stored in ``_lookup``.
+
+        Returns:
+            tuple: the top-level setting, and the tuple of the full names of the subsettings.
+        """
+        root = self
+        keys = ()
+        while root._parent_setting is not None:
+            keys = (root._full_name,) + keys
+            root = root._parent_setting
+        return root, keys
+
+    def _get_backend_value(self, backend):
+        """
+        Return the value of the top-level setting from a backend.
+
+        Args:
+            backend (Backend): the backend.
+
+        Returns:
+            object: the value, parsed if the backend provides strings.
+
+        Raises:
+            AttributeError: if the backend does not provide the value.
+            ValueError: if the string cannot be parsed.
+        """
+        name = self._full_name
+        try:
+            source = backend.source(name)
+            value = source.get(name)
+        except KeyError:
+            raise AttributeError("Setting %s is not provided by the backend" % name) from None
+        if source.strings:
+            value = self._parse_string(value, "Setting")
+        return value
+
+    def _parse_string(self, string, label):
+        """
+        Return the parsed value of a string, parsing it only if it changed.
+
+        The parsed value is kept along with the string it was parsed from,
+        so a variable is only parsed again when it changes.
+
+        Args:
+            string (str): the string.
+            label (str): the kind of variable, for error messages.
+
+        Returns:
+            object: the parsed value.
+
+        Raises:
+            ValueError: if the string cannot be parsed.
+        """
+        parsed = self._get_extra("parsed")
+        if parsed is not None and parsed[0] == string:
+            return parsed[1]
+        try:
+            value = self.parse(string)
+        except ValueError as error:
+            raise ValueError("{} {} has an invalid value: {}".format(label, self._full_name, error))
+        self._set_extra("parsed", (string, value))
+        return value
+
+    def parse(self, value):
+        """
+        Parse the string of an environment variable (or a backend of strings) into a raw value.
+
+        The string is returned unchanged, override this method in
+        subclasses to parse it into the type of the setting.
+
+        Args:
+            value (str): the environment variable.
+
+        Returns:
+            object: the raw value.
+
+        Raises:
+            ValueError: if the string cannot be parsed.
+        """
+        return value
+
+    def _get_raw_value(self, parent_raw=_UNRESOLVED):
+        """
+        Return the raw value, from the raw value of the parent setting if already resolved.
+
+        Args:
+            parent_raw (dict): the raw value of the parent setting, if resolved by the caller.
+
+        Returns:
+            object: the variable defined in ``django.conf.settings``.
+
+        Raises:
+            AttributeError: if the variable is missing.
+            KeyError: if the item is missing from nested setting.
+        """
+        if parent_raw is _UNRESOLVED:
+            return self.raw_value
+        return parent_raw[self._full_name]
 
     @property
     def value(self):
@@ -494,19 +642,31 @@ class Setting(object):
         is required, re-raise an AttributeError. If it is not required,
         return the (optionally transformed) default value.
 
+        Returns:
+            object: the transformed raw value.
+        """
+        return self._get_value()
+
+    def _get_value(self, parent_raw=_UNRESOLVED):
+        """
+        Return the transformed raw or default value, see ``get_value``.
+
+        Args:
+            parent_raw (dict): the raw value of the parent setting, if resolved by the caller.
+
         Returns:
             object: the transformed raw value.
         """
         try:
-            value = self.raw_value
+            value = self._get_raw_value(parent_raw)
         except (AttributeError, KeyError) as err:
             self._reraise_if_required(err)
             default_value = self.default_value
             if self.transform_default:
-                return self.transform(default_value)
+                return self._transform(default_value)
             return default_value
         else:
-            return self.transform(value)
+            return self._transform(value)
 
     def validate(self, value):
         """Run custom validation on the setting value.
@@ -530,26 +690,100 @@ class Setting(object):
         if errors:
             raise ValidationError(errors)
 
-    def check(self):
+    def _is_checked(self, value):
+        """
+        Return whether the value is the last value successfully checked.
+
+        Hashable values are compared by type and equality. Other values are
+        compared by identity, and are considered changed after any
+        ``setting_changed`` signal, since they may have been mutated.
+
+        Args:
+            value (object): the raw value.
+
+        Returns:
+            bool: True if the value does not need to be validated again.
+        """
+        checked = self._checked
+        if checked is value:
+            return True
+        if checked is _UNCHECKED:
+            return False
+        if type(checked) is _Checked:
+            return checked.value is value and checked.version == _settings_version
+        if type(checked) is not type(value):
+            return False
+        try:
+            return bool(checked == value)
+        # pylama:ignore=W0703
+        except Exception:
+            return False
+
+    def _remember_checked(self, value):
+        """Remember the value successfully checked, with the settings version if it is not hashable."""
+        try:
+            hash(value)
+        except TypeError:
+            self._checked = _Checked(value, _settings_version)
+        else:
+            self._checked = value
+
+    def check(self, force=False):
         """
         Run the setting checker against the setting raw value.
 
+        The value is not validated again if it is the last value successfully
+        checked, unless ``force`` is true.
+
+        Args:
+            force (bool): whether to validate the value even if already checked.
+
         Raises:
             AttributeError: if the setting is missing and required.
             ValueError: if the raw value is invalid.
         """
+        self._check(force)
+
+    def _check(self, force=False, parent_raw=_UNRESOLVED):
+        """
+        Check the raw value, see ``check``.
+
+        Args:
+            force (bool): whether to validate the value even if already checked.
+            parent_raw (dict): the raw value of the parent setting, if resolved by the caller.
+
+        Returns:
+            object: the raw value, or ``_UNRESOLVED`` if the setting is missing.
+        """
         try:
-            value = self.raw_value
+            value = self._get_raw_value(parent_raw)
         except (AttributeError, KeyError) as err:
             self._reraise_if_required(err)
-        else:
-            if self.checker:
-                self.checker(self.full_name, value)
-            try:
-                self.validate(value)
-                self.run_validators(value)
-            except ValidationError as error:
-                raise ValueError("Setting {} has an invalid value: {}".format(self.full_name, error))
+            return _UNRESOLVED
+        if not force and self._is_checked(value):
+            return value
+        self._validate(value)
+        # Validation is only stable once the validators are frozen.
+        if isinstance(self._validators, tuple):
+            self._remember_checked(value)
+        return value
+
+    def _transform(self, value):
+        """
+        Transform a value.
+
+        If instrumentation is enabled, the duration is recorded with the key
+        of the value being resolved by an ``AppSettings`` instance, if any.
+        """
+        sink = stats._sink
+        if sink is None:
+            return self.transform(value)
+        start = default_timer()
+        value = self.transform(value)
+        key = stats._resolving.get()
+        if key is not None:
+            sink.timing("transform", key, default_timer() - start)
+        return value
 
     def transform(self, value):
         """
@@ -569,8 +803,23 @@ class Setting(object):
 class BooleanSetting(Setting):
     """Boolean setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(bool),)
 
+    # Parsed values of the environment variable strings.
+    _environ_strings = {
+        "1": True,
+        "true": True,
+        "yes": True,
+        "on": True,
+        "0": False,
+        "false": False,
+        "no": False,
+        "off": False,
+        "": False,
+    }
+
     def __init__(
         self,
         name="",
@@ -604,10 +853,33 @@ class BooleanSetting(Setting):
             validators=validators,
         )
 
+    def parse(self, value):
+        """
+        Parse an environment variable into a boolean.
+
+        Accepted strings are "1", "true", "yes", "on" and "0", "false", "no",
+        "off" or the empty string, case-insensitive.
+
+        Args:
+            value (str): the environment variable.
+
+        Returns:
+            bool: the boolean.
+
+        Raises:
+            ValueError: if the string is not a boolean.
+        """
+        try:
+            return self._environ_strings[value.strip().lower()]
+        except KeyError:
+            raise ValueError("%r is not a boolean" % value) from None
+
 
 class IntegerSetting(Setting):
     """Integer setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(int),)
 
     def __init__(
@@ -647,14 +919,31 @@ class IntegerSetting(Setting):
             validators=validators,
         )
         if minimum is not None:
-            self.validators.append(MinValueValidator(minimum))
+            self.validators.append(_bound_validator(MinValueValidator, minimum))
         if maximum is not None:
-            self.validators.append(MaxValueValidator(maximum))
+            self.validators.append(_bound_validator(MaxValueValidator, maximum))
+
+    def parse(self, value):
+        """
+        Parse an environment variable into an integer.
+
+        Args:
+            value (str): the environment variable.
+
+        Returns:
+            int: the integer.
+
+        Raises:
+            ValueError: if the string is not an integer.
+        """
+        return int(value)
 
 
 class PositiveIntegerSetting(IntegerSetting):
     """Positive integer setting."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name="",
@@ -696,6 +985,8 @@ class PositiveIntegerSetting(IntegerSetting):
 class FloatSetting(IntegerSetting):
     """Float setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(float),)
 
     def __init__(
@@ -737,10 +1028,27 @@ class FloatSetting(IntegerSetting):
             maximum=maximum,
         )
 
+    def parse(self, value):
+        """
+        Parse an environment variable into a float.
+
+        Args:
+            value (str): the environment variable.
+
+        Returns:
+            float: the float.
+
+        Raises:
+            ValueError: if the string is not a float.
+        """
+        return float(value)
+
 
 class PositiveFloatSetting(FloatSetting):
     """Positive float setting."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name="",
@@ -781,7 +1089,16 @@ class PositiveFloatSetting(FloatSetting):
 
 # Iterable settings -----------------------------------------------------------
 class IterableSetting(Setting):
-    """Iterable setting."""
+    """
+    Iterable setting.
+
+    Class attributes:
+        container_type (type): the type built from comma-separated environment variables.
+    """
+
+    __slots__ = ()
+
+    container_type = list
 
     def __init__(
         self,
@@ -823,21 +1140,33 @@ class IterableSetting(Setting):
             transform_default=transform_default,
             validators=validators,
         )
-        if item_type is not None:
-            self.validators.append(ValuesTypeValidator(item_type))
         if empty is not None:
             warnings.warn("Empty argument is deprecated, use min_length instead.", DeprecationWarning)
             if not empty:
                 min_length = 1
-        if min_length is not None:
-            self.validators.append(MinLengthValidator(min_length))
-        if max_length is not None:
-            self.validators.append(MaxLengthValidator(max_length))
+        if item_type is not None or min_length is not None or max_length is not None:
+            self.validators.append(IterableValidator(item_type, min_length, max_length))
+
+    def parse(self, value):
+        """
+        Parse a comma-separated environment variable into a container of strings.
+
+        Items are stripped, and empty ones are dropped.
+
+        Args:
+            value (str): the environment variable.
+
+        Returns:
+            iterable: the items, in a ``container_type`` instance.
+        """
+        return self.container_type(item for item in (item.strip() for item in value.split(",")) if item)
 
 
 class StringSetting(Setting):
     """String setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(str),)
 
     def __init__(
@@ -883,14 +1212,16 @@ class StringSetting(Setting):
             if not empty:
                 min_length = 1
         if min_length is not None:
-            self.validators.append(MinLengthValidator(min_length))
+            self.validators.append(_bound_validator(MinLengthValidator, min_length))
         if max_length is not None:
-            self.validators.append(MaxLengthValidator(max_length))
+            self.validators.append(_bound_validator(MaxLengthValidator, max_length))
 
 
 class ListSetting(IterableSetting):
     """List setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(list),)
 
     def __init__(self, name="", default=list, *args, **kwargs):
@@ -917,6 +1248,10 @@ class ListSetting(IterableSetting):
 class SetSetting(IterableSetting):
     """Set setting."""
 
+    __slots__ = ()
+
+    container_type = set
+
     default_validators = (TypeValidator(set),)
 
     def __init__(self, name="", default=set, *args, **kwargs):
@@ -943,6 +1278,10 @@ class SetSetting(IterableSetting):
 class TupleSetting(IterableSetting):
     """Tuple setting."""
 
+    __slots__ = ()
+
+    container_type = tuple
+
     default_validators = (TypeValidator(tuple),)
 
     def __init__(self, name="", default=tuple, *args, **kwargs):
@@ -970,6 +1309,8 @@ class TupleSetting(IterableSetting):
 class DictSetting(Setting):
     """Dict setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(dict),)
 
     def __init__(
@@ -1020,12 +1361,30 @@ class DictSetting(Setting):
             self.validators.append(DictValuesTypeValidator(value_type))
         if empty is not None:
             warnings.warn("Empty argument is deprecated, use MinLengthValidator instead.", DeprecationWarning)
-            self.validators.append(MinLengthValidator(1))
+            self.validators.append(_bound_validator(MinLengthValidator, 1))
         if min_length is not None:
             warnings.warn("Argument min_length does nothing and is deprecated.", DeprecationWarning)
         if max_length is not None:
             warnings.warn("Argument max_length does nothing and is deprecated.", DeprecationWarning)
 
+    def parse(self, value):
+        """
+        Parse a JSON object environment variable into a dict.
+
+        Args:
+            value (str): the environment variable.
+
+        Returns:
+            dict: the dict.
+
+        Raises:
+            ValueError: if the string is not a JSON object.
+        """
+        value = json.loads(value)
+        if not isinstance(value, dict):
+            raise ValueError("expected a JSON object")
+        return value
+
 
 # Complex settings ------------------------------------------------------------
 class ObjectSetting(Setting):
@@ -1033,8 +1392,12 @@ class ObjectSetting(Setting):
     Object setting.
 
     This setting allows to return an object given its Python path (a.b.c).
+    With ``lazy=True``, the value is a ``LazyImport`` proxy and the path is
+    only imported when the object is first used.
     """
 
+    __slots__ = ("lazy",)
+
     default_validators = (TypeValidator(str),)
 
     def __init__(
@@ -1049,6 +1412,7 @@ class ObjectSetting(Setting):
         min_length=None,
         max_length=None,
         empty=True,
+        lazy=False,
     ):
         """
         Initialization method.
@@ -1065,7 +1429,9 @@ class ObjectSetting(Setting):
             min_length (int): Noop. Deprecated.
             max_length (int): Noop. Deprecated.
             empty (bool): Noop. Deprecated.
+            lazy (bool): whether to import the object only when first used.
         """
+        self.lazy = lazy
         super(ObjectSetting, self).__init__(
             name=name,
             default=default,
@@ -1092,39 +1458,126 @@ class ObjectSetting(Setting):
         ``importlib.import_module`` and each object is obtainable through
         the ``getattr`` method. Local objects will not work.
 
+        Errors raised while importing the modules of the path are propagated
+        unchanged. Resolved paths are cached for the whole process, see
+        ``import_object``.
+
         Args:
             path (str): the dot-separated path of the object.
 
         Returns:
-            object: the imported module or obtained object.
+            object: the imported module or obtained object, or a ``LazyImport`` proxy if the setting is lazy.
         """
         if path is None or not path:
             return None
 
-        obj_parent_modules = path.split(".")
-        objects = [obj_parent_modules.pop(-1)]
+        if self.lazy:
+            return LazyImport(path)
+        return import_object(path)
 
-        while True:
-            try:
-                parent_module_path = ".".join(obj_parent_modules)
-                parent_module = importlib.import_module(parent_module_path)
-                break
-            except ImportError:
-                if len(obj_parent_modules) == 1:
-                    raise ImportError("No module named '%s'" % obj_parent_modules[0])
-                objects.insert(0, obj_parent_modules.pop(-1))
 
-        current_object = parent_module
-        for obj in objects:
-            current_object = getattr(current_object, obj)
-        return current_object
+# Nested settings -------------------------------------------------------------
+def _subsetting_value(subsetting, parent_raw):
+    """
+    Return the value of a subsetting, given the raw value of its parent.
+
+    Settings overriding ``get_value`` are resolved through it, without the
+    parent raw value.
+
+    Args:
+        subsetting (Setting): the subsetting.
+        parent_raw (dict): the raw value of the parent setting.
+
+    Returns:
+        object: the value of the subsetting.
+    """
+    if type(subsetting).get_value in (Setting.get_value, NestedSetting.get_value):
+        return subsetting._get_value(parent_raw)
+    return subsetting.get_value()
+
+
+def _check_subsetting(subsetting, force, parent_raw):
+    """
+    Check a subsetting, given the raw value of its parent.
+
+    Settings overriding ``check`` are checked through it, without the parent
+    raw value, and without arguments unless forced, to support overrides
+    which do not accept ``force``.
+
+    Args:
+        subsetting (Setting): the subsetting.
+        force (bool): whether to validate the value even if already checked.
+        parent_raw (dict): the raw value of the parent setting.
+    """
+    if type(subsetting).check in (Setting.check, NestedSetting.check):
+        subsetting._check(force, parent_raw)
+    elif force:
+        subsetting.check(force=True)
+    else:
+        subsetting.check()
+
+
+class NestedValues(Mapping):
+    """
+    Read-only mapping of the values of the subsettings of a nested setting.
+
+    Each value is resolved on first access to its key, then kept. Iteration,
+    length and membership only use the subsettings names, and resolve
+    nothing. Comparisons with dicts resolve every value.
+    """
+
+    __slots__ = ("_settings", "_raw", "_values")
+
+    def __init__(self, settings, raw=_UNRESOLVED):
+        """
+        Initialization method.
+
+        Args:
+            settings (dict): the subsettings, by key.
+            raw (dict): the raw value of the nested setting, if already resolved.
+        """
+        self._settings = settings
+        self._raw = raw
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        subsetting = self._settings[key]
+        return self._values.setdefault(key, _subsetting_value(subsetting, self._raw))
+
+    def __contains__(self, key):
+        return key in self._settings
+
+    def __iter__(self):
+        return iter(self._settings)
+
+    def __len__(self):
+        return len(self._settings)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, dict(self))
 
 
-# Nested settings -------------------------------------------------------------
 class NestedSetting(DictSetting):
-    """Nested setting."""
+    """
+    Nested setting.
+
+    With ``lazy=True``, the value is a ``NestedValues`` read-only mapping
+    resolving each subsetting value on first access, instead of a dict.
+
+    Once the setting is declared, the paths to every subsetting, however
+    deep, are stored in ``_paths`` as (dotted keys, dotted full names,
+    subsettings chain) tuples. For example, the ``inner`` subsetting of a
+    ``child`` subsetting has the ``"child.inner"`` and ``"CHILD.INNER"``
+    paths, and the ``(child, inner)`` chain.
+    """
 
-    def __init__(self, settings, *args, **kwargs):
+    __slots__ = ("settings", "lazy", "_paths")
+
+    def __init__(self, settings, *args, lazy=False, **kwargs):
         """
         Initialization method.
 
@@ -1143,50 +1596,107 @@ class NestedSetting(DictSetting):
             min_length (int): minimum length of the iterable (included).
             max_length (int): maximum length of the iterable (included).
             empty (bool): whether empty iterable is allowed. Deprecated in favor of min_length.
+            lazy (bool): whether to resolve each subsetting value only when first accessed.
         """
+        self.settings = settings
+        self.lazy = lazy
+        self._paths = ()
         super(NestedSetting, self).__init__(*args, **kwargs)
         for subname, subsetting in settings.items():
             if subsetting.name == "":
                 subsetting.name = subname
             subsetting.parent_setting = self
-        self.settings = settings
+
+    def _freeze(self):
+        """Store the validators of the setting and its subsettings as tuples, and their paths."""
+        super(NestedSetting, self)._freeze()
+        paths = []
+        for key, subsetting in self.settings.items():
+            subsetting._freeze()
+            paths.append((key, subsetting.full_name, (subsetting,)))
+            for keys, full_names, chain in subsetting._paths:
+                paths.append(
+                    ("%s.%s" % (key, keys), "%s.%s" % (subsetting.full_name, full_names), (subsetting,) + chain)
+                )
+        self._paths = tuple(paths)
+        if self._parent_setting is None:
+            # The top-level setting stores the lookup of every subsetting, however deep.
+            for _, _, chain in paths:
+                chain[-1]._lookup = (self, tuple(subsetting._full_name for subsetting in chain))
 
     def get_value(self):
         """
         Return dictionary with values of subsettings.
 
+        The raw value of the setting is looked up once, and handed down to
+        the subsettings.
+
+        Returns:
+            dict: values of subsettings, a ``NestedValues`` mapping if the setting is lazy.
+        """
+        return self._get_value()
+
+    def _get_value(self, parent_raw=_UNRESOLVED):
+        """
+        Return dictionary with values of subsettings, see ``get_value``.
+
+        Args:
+            parent_raw (dict): the raw value of the parent setting, if resolved by the caller.
+
         Returns:
-            dict: values of subsettings.
+            dict: values of subsettings, a ``NestedValues`` mapping if the setting is lazy.
         """
         try:
-            self.raw_value
+            raw = self._get_raw_value(parent_raw)
         except (AttributeError, KeyError) as err:
             self._reraise_if_required(err)
             default_value = self.default_value
             if self.transform_default:
-                return self.transform(default_value)
+                return self._transform(default_value)
             return default_value
         else:
+            if self.lazy:
+                return NestedValues(self.settings, raw)
             # If setting is defined, load values of all subsettings.
             value = {}
             for key, subsetting in self.settings.items():
-                value[key] = subsetting.get_value()
+                value[key] = _subsetting_value(subsetting, raw)
             return value
 
-    def check(self):
+    def check(self, force=False):
         """
         Run the setting checker against the setting raw value.
 
+        The raw value of the setting is looked up once, and handed down to
+        the subsettings.
+
+        Args:
+            force (bool): whether to validate the values even if already checked.
+
         Raises:
             AttributeError: if the setting is missing and required.
             ValueError: (or other Exception) if the raw value is invalid.
         """
-        super(NestedSetting, self).check()
+        self._check(force)
+
+    def _check(self, force=False, parent_raw=_UNRESOLVED):
+        """
+        Check the raw value and the subsettings, see ``check``.
+
+        Args:
+            force (bool): whether to validate the values even if already checked.
+            parent_raw (dict): the raw value of the parent setting, if resolved by the caller.
+
+        Returns:
+            object: the raw value, or ``_UNRESOLVED`` if the setting is missing.
+        """
+        raw = super(NestedSetting, self)._check(force, parent_raw)
         errors = []
         for subsetting in self.settings.values():
             try:
-                subsetting.check()
+                _check_subsetting(subsetting, force, raw)
             except ValidationError as error:
                 errors.extend(error.messages)
         if errors:
             raise ValidationError(errors)
+        return raw
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stats module.
+
+This module defines the optional instrumentation of settings access and
+resolution. Instrumentation is disabled until a stats sink is set with
+``set_stats_sink``.
+"""
+
+import collections
+import sys
+import threading
+from contextvars import ContextVar
+
+_sink = None
+
+# Key of the value being resolved by an ``AppSettings`` instance, with which
+# the settings record the duration of their transformations.
+_resolving = ContextVar("appsettings_resolving", default=None)
+
+
+def get_stats_sink():
+    """
+    Return the current stats sink.
+
+    Returns:
+        StatsSink: the current stats sink, or None if instrumentation is disabled.
+    """
+    return _sink
+
+
+def set_stats_sink(sink):
+    """
+    Set the stats sink receiving the instrumentation events.
+
+    Values already resolved are stored in the ``__dict__`` of the
+    ``AppSettings`` instances, where reads are not instrumented. When a
+    sink is set, they are dropped from the ``__dict__`` of every live
+    instance (but kept in their cache), so their next reads are recorded.
+
+    Args:
+        sink (StatsSink): the stats sink, or None to disable instrumentation.
+    """
+    global _sink
+    _sink = sink
+    if sink is None:
+        return
+    # No instance exists if the module defining them is not imported yet.
+    app_settings = sys.modules.get(__package__ + ".app_settings")
+    if app_settings is not None:
+        for cls in app_settings._Metaclass.registered_classes():
+            for instance in list(cls._meta.instances):
+                instance._drop_instance_values()
+
+
+class StatsSink(object):
+    """
+    Base stats sink.
+
+    Every method does nothing. Inherit from this class to forward the
+    instrumentation events to your monitoring system.
+
+    Every event is recorded with the same key format: the ``AppSettings``
+    class name and the setting variable name, or dotted path for the values
+    of subsettings, like ``"AppConf.my_int"`` or ``"AppConf.nested.inner"``.
+    """
+
+    def hit(self, key):
+        """
+        Record a read of a cached value.
+
+        Args:
+            key (str): the ``AppSettings`` class name and setting variable name.
+        """
+
+    def miss(self, key):
+        """
+        Record a read of a value which was not cached.
+
+        Args:
+            key (str): the ``AppSettings`` class name and setting variable name.
+        """
+
+    def invalidation(self, key):
+        """
+        Record the invalidation of a cached value.
+
+        Args:
+            key (str): the ``AppSettings`` class name and setting variable name.
+        """
+
+    def timing(self, event, key, seconds):
+        """
+        Record the duration of a setting operation.
+
+        Transformations are recorded with the key of the value being resolved,
+        so the transformations of subsettings are recorded with the key of
+        their nested setting, and transformations outside of an ``AppSettings``
+        instance are not recorded.
+
+        Args:
+            event (str): the operation, one of "get_value", "transform" and "check".
+            key (str): the ``AppSettings`` class name and setting variable name.
+            seconds (float): the duration of the operation.
+        """
+
+
+class Histogram(object):
+    """Histogram of durations, with power-of-two microseconds buckets."""
+
+    def __init__(self):
+        """Initialization method."""
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = collections.Counter()
+
+    @property
+    def mean(self):
+        """
+        Property to return the mean duration.
+
+        Returns:
+            float: the mean duration in seconds, or None if empty.
+        """
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def add(self, seconds):
+        """
+        Add a duration to the histogram.
+
+        Bucket ``n`` counts the durations between ``2 ** (n - 1)`` (included)
+        and ``2 ** n`` (excluded) microseconds, bucket 0 counts the durations
+        below one microsecond.
+
+        Args:
+            seconds (float): the duration.
+        """
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+        self.buckets[int(seconds * 1e6).bit_length()] += 1
+
+
+class InMemoryStatsSink(StatsSink):
+    """
+    Stats sink keeping everything in memory.
+
+    Attributes:
+        hits (Counter): cached reads count, by key.
+        misses (Counter): uncached reads count, by key.
+        invalidations (Counter): invalidations count, by key.
+        timings (dict): ``Histogram`` of durations, by (event, key) tuple.
+    """
+
+    def __init__(self):
+        """Initialization method."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.hits = collections.Counter()
+            self.misses = collections.Counter()
+            self.invalidations = collections.Counter()
+            self.timings = collections.defaultdict(Histogram)
+
+    def hit(self, key):
+        """Record a read of a cached value."""
+        with self._lock:
+            self.hits[key] += 1
+
+    def miss(self, key):
+        """Record a read of a value which was not cached."""
+        with self._lock:
+            self.misses[key] += 1
+
+    def invalidation(self, key):
+        """Record the invalidation of a cached value."""
+        with self._lock:
+            self.invalidations[key] += 1
+
+    def timing(self, event, key, seconds):
+        """Record the duration of a setting operation."""
+        with self._lock:
+            self.timings[(event, key)].add(seconds)
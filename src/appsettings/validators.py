@@ -1,16 +1,93 @@
 """Basic set of setting validators."""
+import array
+
 from django.core.exceptions import ValidationError
+from django.core.validators import MaxLengthValidator, MinLengthValidator
+
+# Containers whose elements can be checked in bulk, without consuming them.
+_CONTAINER_TYPES = frozenset((list, tuple, set, frozenset, dict, type({}.keys()), type({}.values()), type({}.items())))
+
+# Below this length, checking the elements one by one is faster.
+_BULK_MIN_LENGTH = 32
+
+# Type of the elements of an array.array, by type code. Other type codes are checked element by element.
+_ARRAY_ITEM_TYPES = dict.fromkeys("bBhHiIlLqQ", int)
+_ARRAY_ITEM_TYPES.update({"f": float, "d": float, "u": str, "w": str})
+
+
+def _all_instances(values, value_type):
+    """
+    Return whether all the values are instances of the given type, using bulk checks.
+
+    For builtin containers (except small ones), the set of the types of the
+    values is computed and each type is checked once. The types of the elements of
+    ``array.array`` and one-dimensional NumPy arrays are known from the
+    array type, so they are checked without iterating at all.
+
+    A false result means that the values could not be checked in bulk or
+    that some value may be invalid: the caller must then check them one by
+    one, with ``isinstance``.
+
+    Args:
+        values (iterable): the values to check.
+        value_type (type): the expected type, or a tuple of types.
+
+    Returns:
+        bool: True if all the values are instances of the type.
+    """
+    values_type = type(values)
+    if values_type in _CONTAINER_TYPES:
+        if len(values) < _BULK_MIN_LENGTH:
+            return False
+        for element_type in set(map(type, values)):
+            if not issubclass(element_type, value_type):
+                return False
+        return True
+    if isinstance(values, array.array):
+        item_type = _ARRAY_ITEM_TYPES.get(values.typecode)
+        return item_type is not None and issubclass(item_type, value_type)
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and getattr(values, "ndim", None) == 1:
+        # NumPy one-dimensional array, its elements are instances of dtype.type.
+        return isinstance(dtype.type, type) and issubclass(dtype.type, value_type)
+    return False
+
+
+class _BaseValidator(object):
+    """
+    Base class for validators, with an overridable message.
+
+    Validators use ``__slots__`` to keep their memory footprint small. The
+    default message is given by the ``default_message`` class attribute.
+    """
+
+    __slots__ = ("_message",)
+
+    default_message = ""
+
+    def __init__(self, message=None):
+        self._message = message
 
+    @property
+    def message(self):
+        """Return the custom message if any, or the default one."""
+        return self._message or self.default_message
 
-class TypeValidator(object):
+    @message.setter
+    def message(self, message):
+        self._message = message
+
+
+class TypeValidator(_BaseValidator):
     """Validator which checks type of the value."""
 
-    message = "Value %(value)s is not of type %(type)s."
+    __slots__ = ("value_type",)
+
+    default_message = "Value %(value)s is not of type %(type)s."
 
     def __init__(self, value_type, message=None):
+        super(TypeValidator, self).__init__(message)
         self.value_type = value_type
-        if message:
-            self.message = message
 
     def __call__(self, value):
         if not isinstance(value, self.value_type):
@@ -18,52 +95,123 @@ class TypeValidator(object):
             raise ValidationError(self.message, params=params)
 
 
-class ValuesTypeValidator(object):
+class ValuesTypeValidator(_BaseValidator):
     """Validator which checks types of iterable values."""
 
-    message = "Element %(value)s is not of type %(type)s."
+    __slots__ = ("value_type",)
+
+    default_message = "Element %(value)s is not of type %(type)s."
 
     def __init__(self, value_type, message=None):
+        super(ValuesTypeValidator, self).__init__(message)
         self.value_type = value_type
-        if message:
-            self.message = message
 
     def __call__(self, value):
+        if _all_instances(value, self.value_type):
+            return
         for element in value:
             if not isinstance(element, self.value_type):
                 params = {"value": element, "type": self.value_type.__name__}
                 raise ValidationError(self.message, params=params)
 
 
-class DictKeysTypeValidator(object):
+class DictKeysTypeValidator(_BaseValidator):
     """Validator which checks types of dict keys."""
 
-    message = "The key %(key)s is not of type %(type)s."
+    __slots__ = ("key_type",)
+
+    default_message = "The key %(key)s is not of type %(type)s."
 
     def __init__(self, key_type, message=None):
+        super(DictKeysTypeValidator, self).__init__(message)
         self.key_type = key_type
-        if message:
-            self.message = message
 
     def __call__(self, value):
+        if _all_instances(value, self.key_type):
+            return
         for key in value:
             if not isinstance(key, self.key_type):
                 params = {"key": key, "type": self.key_type.__name__}
                 raise ValidationError(self.message, params=params)
 
 
-class DictValuesTypeValidator(object):
+class DictValuesTypeValidator(_BaseValidator):
     """Validator which checks types of dict values."""
 
-    message = "Item %(key)s's value %(value)s is not of type %(type)s."
+    __slots__ = ("value_type",)
+
+    default_message = "Item %(key)s's value %(value)s is not of type %(type)s."
 
     def __init__(self, value_type, message=None):
+        super(DictValuesTypeValidator, self).__init__(message)
         self.value_type = value_type
-        if message:
-            self.message = message
 
     def __call__(self, value):
+        if _all_instances(value.values(), self.value_type):
+            return
         for key, element in value.items():
             if not isinstance(element, self.value_type):
                 params = {"key": key, "value": element, "type": self.value_type.__name__}
                 raise ValidationError(self.message, params=params)
+
+
+class IterableValidator(object):
+    """
+    Validator which checks the types of iterable values and its length, in a single pass.
+
+    The value is iterated only once, so generators and other iterators can
+    be validated. Iteration stops as soon as the maximum length is exceeded.
+    Length errors use the messages of Django ``MinLengthValidator`` and
+    ``MaxLengthValidator``, except when an iterator without length exceeds
+    the maximum length.
+    """
+
+    __slots__ = ("item_type", "min_length", "max_length")
+
+    too_long_message = "Ensure this value has at most %(limit_value)d elements (it has more)."
+
+    def __init__(self, item_type=None, min_length=None, max_length=None):
+        self.item_type = item_type
+        self.min_length = min_length
+        self.max_length = max_length
+
+    @staticmethod
+    def _length_error(validator_class, limit_value, length, value):
+        validator = validator_class(limit_value)
+        params = {"limit_value": limit_value, "show_value": length, "value": value}
+        return ValidationError(validator.message, code=validator.code, params=params)
+
+    def __call__(self, value):
+        item_type, max_length = self.item_type, self.max_length
+        invalid = []
+        if type(value) in _CONTAINER_TYPES and (item_type is None or _all_instances(value, item_type)):
+            # No need to iterate.
+            count = len(value)
+            too_long = max_length is not None and count > max_length
+        else:
+            count = 0
+            too_long = False
+            for element in value:
+                count += 1
+                if max_length is not None and count > max_length:
+                    too_long = True
+                    break
+                if item_type is not None and not invalid and not isinstance(element, item_type):
+                    invalid.append(element)
+
+        errors = []
+        if invalid:
+            params = {"value": invalid[0], "type": item_type.__name__}
+            errors.append(ValidationError(ValuesTypeValidator.default_message, params=params))
+        if self.min_length is not None and count < self.min_length:
+            errors.append(self._length_error(MinLengthValidator, self.min_length, count, value))
+        if too_long:
+            try:
+                length = len(value)
+            except TypeError:
+                params = {"limit_value": max_length}
+                errors.append(ValidationError(self.too_long_message, code="max_length", params=params))
+            else:
+                errors.append(self._length_error(MaxLengthValidator, max_length, length, value))
+        if errors:
+            raise ValidationError(errors)
@@ -2,12 +2,21 @@
 
 """Main test script."""
 
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+
+import django
 import mock
 import pytest
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.test import SimpleTestCase, override_settings
 
 import appsettings
+from appsettings.app_settings import _Metaclass
+from appsettings.checks import check_settings
 
 
 def imported_object():
@@ -188,6 +197,58 @@ class SettingTestCase(SimpleTestCase):
         assert setting.prefix == "Prefix_"
         assert setting.full_name == "PREFIX_NAME"
 
+    def test_setting_names_recomputed(self):
+        inner = appsettings.Setting(name="inner")
+        setting = appsettings.NestedSetting(name="outer", settings=dict(inner=inner))
+        with override_settings(OUTER={"INNER": 1}):
+            assert inner.raw_value == 1
+        setting.prefix = "prefix_"
+        assert setting.full_name == "PREFIX_OUTER"
+        with override_settings(PREFIX_OUTER={"INNER": 2}):
+            assert inner.raw_value == 2
+        inner.name = "renamed"
+        assert inner.full_name == "RENAMED"
+        with override_settings(PREFIX_OUTER={"RENAMED": 3}):
+            assert inner.raw_value == 3
+
+    def test_declared_setting_lookup(self):
+        inner = appsettings.Setting()
+        child = appsettings.NestedSetting(settings=dict(inner=inner))
+
+        class AppConf(appsettings.AppSettings):
+            nested = appsettings.NestedSetting(settings=dict(child=child))
+
+        assert AppConf.nested._lookup is None
+        assert child._lookup == (AppConf.nested, ("CHILD",))
+        assert inner._lookup == (AppConf.nested, ("CHILD", "INNER"))
+        with override_settings(NESTED={"CHILD": {"INNER": 1}}):
+            assert inner.raw_value == 1
+
+    def test_declared_setting_renamed(self):
+        class AppConf(appsettings.AppSettings):
+            number = appsettings.IntegerSetting()
+            nested = appsettings.NestedSetting(settings=dict(inner=appsettings.IntegerSetting()))
+
+        appconf = AppConf()
+        with override_settings(NUMBER=5, NESTED={"INNER": 1}):
+            assert appconf.number == 5
+            assert appconf.get("NESTED.INNER") == 1
+
+        AppConf.number.prefix = "prefix_"
+        AppConf.nested.name = "renamed"
+        inner = AppConf.nested.settings["inner"]
+        inner.name = "other"
+        assert AppConf.number.full_name == "PREFIX_NUMBER"
+        assert inner._lookup == (AppConf.nested, ("OTHER",))
+        assert AppConf._meta.names == {"PREFIX_NUMBER": ["number"], "RENAMED": ["nested"]}
+        assert AppConf._meta.paths == {"number": [], "nested": ["nested.inner", "RENAMED.OTHER"]}
+        assert "NESTED.INNER" not in AppConf._meta.index
+        assert appconf._cache == {}
+        with override_settings(NUMBER=5, PREFIX_NUMBER=6, RENAMED={"OTHER": 2}):
+            assert appconf.number == 6
+            assert appconf.nested == {"inner": 2}
+            assert appconf.get("RENAMED.OTHER") == 2
+
     def test_setting_default_callable(self):
         setting = appsettings.Setting(default=lambda: 1, call_default=True)
         assert setting.value == 1
@@ -252,6 +313,26 @@ class SettingTestCase(SimpleTestCase):
 
         assert validator.mock_calls == [mock.call(mock.sentinel.lister)]
 
+    def test_setting_validators_fail_all_reported(self):
+        validators = [
+            mock.Mock(side_effect=ValidationError("First")),
+            mock.Mock(),
+            mock.Mock(side_effect=ValidationError("Third")),
+        ]
+
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.Setting(name="INQUISITOR", validators=validators)
+
+        with self.settings(INQUISITOR=mock.sentinel.lister):
+            with pytest.raises(ValueError, match=r"invalid value: \['First', 'Third'\]"):
+                AppConf.setting.check()
+            AppConf.setting.validators[0].side_effect = None
+            with pytest.raises(ValueError, match=r"invalid value: \['Third'\]"):
+                AppConf.setting.check()
+
+        for validator in validators:
+            assert validator.mock_calls == [mock.call(mock.sentinel.lister)] * 2
+
     def test_setting_custom_validate(self):
         # Test custom validate method
         class TestSetting(appsettings.Setting):
@@ -264,6 +345,40 @@ class SettingTestCase(SimpleTestCase):
             with pytest.raises(ValueError, match="Setting INQUISITOR has an invalid value:.*You're not worthy!"):
                 setting.check()
 
+    def test_setting_custom_run_validators(self):
+        class TestSetting(appsettings.IntegerSetting):
+            def run_validators(self, value):
+                raise ValidationError("too big")
+
+        class AppConf(appsettings.AppSettings):
+            number = TestSetting()
+
+        with self.settings(NUMBER=1):
+            with pytest.raises(ImproperlyConfigured, match="Setting NUMBER has an invalid value:.*too big"):
+                AppConf.check()
+
+    def test_setting_validators_replaced(self):
+        class AppConf(appsettings.AppSettings):
+            number = appsettings.IntegerSetting()
+
+        with self.settings(NUMBER=1):
+            AppConf.check()
+            AppConf.number.validators = (mock.Mock(side_effect=ValidationError("too big")),)
+            with pytest.raises(ImproperlyConfigured, match="Setting NUMBER has an invalid value:.*too big"):
+                AppConf.check()
+
+    def test_setting_validators_shared(self):
+        class AppConf(appsettings.AppSettings):
+            first = appsettings.IntegerSetting(minimum=0)
+            second = appsettings.IntegerSetting(minimum=0, maximum=10)
+            third = appsettings.IntegerSetting()
+
+        assert AppConf.first.validators[1] is AppConf.second.validators[1]
+        assert AppConf.third.validators is appsettings.IntegerSetting.default_validators
+        assert appsettings.FloatSetting(minimum=0.0).validators[1].limit_value == 0.0
+        unhashable = [appsettings.FloatSetting(minimum=[]) for _ in range(2)]
+        assert unhashable[0].validators[1] is not unhashable[1].validators[1]
+
     def test_setting_checker(self):
         class Setting(appsettings.Setting):
             def checker(self, name, value):
@@ -389,6 +504,23 @@ class SettingTestCase(SimpleTestCase):
         with override_settings(OBJECT=None):
             assert setting.value is None
 
+    def test_object_setting_lazy(self):
+        setting = appsettings.ObjectSetting(name="object", lazy=True)
+        assert setting.value is None
+        with override_settings(OBJECT="tests.test_appsettings.imported_object"):
+            with mock.patch("appsettings.imports.import_object", wraps=appsettings.imports.import_object) as importer:
+                value = setting.value
+                assert isinstance(value, appsettings.LazyImport)
+                assert repr(value) == "<LazyImport: 'tests.test_appsettings.imported_object'>"
+                importer.assert_not_called()
+                assert value() == "tests.test_appsettings.SettingTestCase._imported_object2"
+                assert value.__name__ == "imported_object"
+                importer.assert_called_once_with("tests.test_appsettings.imported_object")
+        with override_settings(OBJECT="this_package.does_not_exist"):
+            value = setting.value
+            with pytest.raises(ImportError):
+                value()
+
     def test_nested_setting(self):
         setting = appsettings.NestedSetting(settings=dict())
         assert setting.value == {}
@@ -408,6 +540,73 @@ class SettingTestCase(SimpleTestCase):
         with override_settings(SETTING={"BOOL3": False}):
             assert setting.value == {"bool1": False, "bool2": False}
 
+    def test_nested_setting_raw_value_once(self):
+        setting = appsettings.NestedSetting(
+            name="setting",
+            settings=dict(
+                inner=appsettings.NestedSetting(
+                    settings=dict(first=appsettings.IntegerSetting(), second=appsettings.IntegerSetting())
+                ),
+                other=appsettings.IntegerSetting(default=3),
+            ),
+        )
+        raw = {"INNER": {"FIRST": 1, "SECOND": 2}}
+        with mock.patch.object(appsettings.Setting, "raw_value", new_callable=mock.PropertyMock) as raw_value:
+            raw_value.return_value = raw
+            assert setting.get_value() == {"inner": {"first": 1, "second": 2}, "other": 3}
+            setting.check()
+        assert raw_value.call_count == 2
+
+    def test_nested_setting_lazy(self):
+        inner = appsettings.ObjectSetting()
+
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.NestedSetting(
+                lazy=True, settings=dict(integer=appsettings.IntegerSetting(default=1), inner=inner)
+            )
+
+        appconf = AppConf()
+        with override_settings(SETTING={"INNER": "tests.test_appsettings.imported_object"}):
+            with mock.patch.object(type(inner), "get_value", autospec=True, side_effect=lambda self: 2) as get_value:
+                value = appconf.setting
+                assert isinstance(value, appsettings.NestedValues)
+                assert appconf._cache["setting"] is value
+                assert sorted(value) == ["inner", "integer"]
+                assert len(value) == 2 and "inner" in value and "other" not in value
+                get_value.assert_not_called()
+                assert value["inner"] == 2
+                assert value["inner"] == 2
+                get_value.assert_called_once_with(inner)
+            assert value == {"integer": 1, "inner": 2}
+            with pytest.raises(KeyError):
+                value["other"]
+            with pytest.raises(TypeError):
+                value["inner"] = 3
+
+    def test_setting_parse(self):
+        assert appsettings.Setting().parse("a,b") == "a,b"
+        assert appsettings.StringSetting().parse(" a ") == " a "
+        for string in ("1", "True", "yes", " ON "):
+            assert appsettings.BooleanSetting().parse(string) is True
+        for string in ("0", "false", "No", "off", ""):
+            assert appsettings.BooleanSetting().parse(string) is False
+        with pytest.raises(ValueError):
+            appsettings.BooleanSetting().parse("maybe")
+        assert appsettings.IntegerSetting().parse("42") == 42
+        assert appsettings.PositiveIntegerSetting().parse("42") == 42
+        with pytest.raises(ValueError):
+            appsettings.IntegerSetting().parse("4.2")
+        assert appsettings.FloatSetting().parse("4.2") == 4.2
+        assert appsettings.ListSetting().parse("a, b,,c ") == ["a", "b", "c"]
+        assert appsettings.ListSetting().parse("") == []
+        assert appsettings.SetSetting().parse("a,b,a") == {"a", "b"}
+        assert appsettings.TupleSetting().parse("a,b") == ("a", "b")
+        assert appsettings.DictSetting().parse('{"a": [1]}') == {"a": [1]}
+        with pytest.raises(ValueError):
+            appsettings.DictSetting().parse("[1]")
+        with pytest.raises(ValueError):
+            appsettings.NestedSetting(settings={}).parse("{")
+
 
 class AppSettingsTestCase(SimpleTestCase):
     def test_instantiation(self):
@@ -425,6 +624,22 @@ class AppSettingsTestCase(SimpleTestCase):
         with pytest.raises(RuntimeError):
             assert not appsettings.AppSettings()
 
+    def test_reserved_names(self):
+        names = ("get", "check", "preload", "snapshot", "override", "invalidate_cache", "settings")
+        instance_names = ("_cache", "_pending", "_lock", "_overrides", "_overridden")
+        for name in names + instance_names:
+            with pytest.raises(ImproperlyConfigured, match="clashes"):
+                type("AppConf", (appsettings.AppSettings,), {name: appsettings.Setting()})
+
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.Setting()
+
+        class SubAppConf(AppConf):
+            setting = appsettings.Setting()
+
+        with pytest.raises(ImproperlyConfigured, match="clashes"):
+            type("SubAppConf", (AppConf,), {"_meta": appsettings.Setting()})
+
     def test_populating_name(self):
         class AppConf(appsettings.AppSettings):
             without_name = appsettings.Setting()
@@ -466,6 +681,196 @@ class AppSettingsTestCase(SimpleTestCase):
 
         assert AppConf.settings["setting"].full_name == "PREFIX_NAME"
 
+    def test_frozen_validators(self):
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.IntegerSetting(minimum=0)
+            nested = appsettings.NestedSetting(settings=dict(inner=appsettings.IntegerSetting(maximum=1)))
+
+        assert isinstance(AppConf.setting.validators, tuple)
+        assert len(AppConf.setting.validators) == 2
+        assert isinstance(AppConf.nested.validators, tuple)
+        assert isinstance(AppConf.nested.settings["inner"].validators, tuple)
+        assert not hasattr(AppConf.setting, "__dict__")
+        assert not hasattr(AppConf.nested, "__dict__")
+
+    def test_check_memoized(self):
+        validator = mock.Mock()
+
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.IntegerSetting(validators=[validator])
+            items = appsettings.ListSetting(validators=[validator])
+
+        with override_settings(SETTING=1, ITEMS=[1]):
+            AppConf.check()
+            AppConf.check()
+            assert validator.call_count == 2
+            AppConf.check(force=True)
+            assert validator.call_count == 4
+        with override_settings(SETTING=1, ITEMS=[1]):
+            # Equal hashable value is not validated again, the unhashable one is.
+            AppConf.check()
+            assert validator.call_count == 5
+        with override_settings(SETTING=2):
+            AppConf.check()
+            assert validator.call_count == 6
+
+    def test_check_memoized_failure(self):
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.IntegerSetting(minimum=0)
+
+        with override_settings(SETTING=-1):
+            for _ in range(2):
+                with pytest.raises(ImproperlyConfigured):
+                    AppConf.check()
+
+    def test_check_iterable_setting(self):
+        class AppConf(appsettings.AppSettings):
+            numbers = appsettings.ListSetting(item_type=int, min_length=2, max_length=3)
+            items = appsettings.IterableSetting(item_type=int, max_length=2)
+
+        cases = (
+            ([1, "a"], [1], "Setting NUMBERS has an invalid value: ['Element a is not of type int.']"),
+            (
+                [1],
+                [1],
+                "Setting NUMBERS has an invalid value: ['Ensure this value has at least 2 characters (it has 1).']",
+            ),
+            (
+                [1, 2, 3, 4],
+                [1],
+                "Setting NUMBERS has an invalid value: ['Ensure this value has at most 3 characters (it has 4).']",
+            ),
+            (
+                ["a"],
+                [1],
+                "Setting NUMBERS has an invalid value: "
+                "['Element a is not of type int.', 'Ensure this value has at least 2 characters (it has 1).']",
+            ),
+            (
+                [1, 2],
+                (item for item in ["a", 2, 3]),
+                "Setting ITEMS has an invalid value: "
+                "['Element a is not of type int.', 'Ensure this value has at most 2 elements (it has more).']",
+            ),
+        )
+        for numbers, items, message in cases:
+            with override_settings(NUMBERS=numbers, ITEMS=items):
+                with pytest.raises(ImproperlyConfigured) as error:
+                    AppConf.check()
+                assert str(error.value) == message
+        with override_settings(NUMBERS=[1, 2, 3], ITEMS=(item for item in [1, 2])):
+            AppConf.check()
+
+    def test_check_legacy_override(self):
+        class LegacySetting(appsettings.Setting):
+            def check(self):
+                self.checked = True
+
+        class AppConf(appsettings.AppSettings):
+            setting = LegacySetting()
+            nested = appsettings.NestedSetting(settings=dict(inner=LegacySetting()))
+
+        with override_settings(NESTED={"INNER": 1}):
+            AppConf.check()
+            assert AppConf.settings["setting"].checked
+            assert AppConf.settings["nested"].settings["inner"].checked
+
+    def test_get(self):
+        leaf = appsettings.IntegerSetting(name="timeout", default=300)
+
+        class AppConf(appsettings.AppSettings):
+            cache = appsettings.NestedSetting(
+                settings=dict(
+                    backends=appsettings.NestedSetting(
+                        settings=dict(default=appsettings.NestedSetting(settings=dict(timeout=leaf)))
+                    ),
+                    other=appsettings.ObjectSetting(),
+                )
+            )
+            plain = appsettings.IntegerSetting(default=1)
+
+            class Meta:
+                setting_prefix = "app_"
+
+        appconf = AppConf()
+        assert appconf.get("plain") == appconf.get("APP_PLAIN") == 1
+        with pytest.raises(AttributeError):
+            appconf.get("cache.backends.missing")
+        # Missing ancestor: whole nested value semantics.
+        with pytest.raises(KeyError):
+            appconf.get("cache.backends.default.timeout")
+
+        raw = {"BACKENDS": {"DEFAULT": {"TIMEOUT": 10}}, "OTHER": "no.such.module"}
+        with override_settings(APP_CACHE=raw):
+            assert appconf.get("cache.backends.default.timeout") == 10
+            assert appconf.get("APP_CACHE.BACKENDS.DEFAULT.TIMEOUT") == 10
+            assert appconf.get("cache.backends.default") == {"timeout": 10}
+            assert appconf._cache == {
+                "plain": 1,
+                "cache.backends.default.timeout": 10,
+                "APP_CACHE.BACKENDS.DEFAULT.TIMEOUT": 10,
+                "cache.backends.default": {"timeout": 10},
+            }
+            with mock.patch.object(appsettings.IntegerSetting, "get_value") as get_value:
+                assert appconf.get("cache.backends.default.timeout") == 10
+                get_value.assert_not_called()
+            with appconf.override(cache={"backends": {"default": {"timeout": 20}}}):
+                assert appconf.get("cache.backends.default.timeout") == 20
+
+        with override_settings(APP_CACHE={"BACKENDS": {"DEFAULT": {"TIMEOUT": 30}}}):
+            assert appconf.get("cache.backends.default.timeout") == 30
+            assert appconf.cache == {"backends": {"default": {"timeout": 30}}, "other": None}
+            assert appconf.get("cache.backends.default.timeout") == 30
+
+    def test_environ(self):
+        class AppConf(appsettings.AppSettings):
+            workers = appsettings.IntegerSetting(default=1)
+            hosts = appsettings.ListSetting()
+            cache = appsettings.NestedSetting(settings=dict(timeout=appsettings.IntegerSetting(default=300)))
+
+            class Meta:
+                setting_prefix = "app_"
+                environ = True
+
+        class NoEnvironAppConf(appsettings.AppSettings):
+            workers = appsettings.IntegerSetting(default=1)
+
+            class Meta:
+                setting_prefix = "app_"
+
+        environ = {"APP_WORKERS": "4", "APP_HOSTS": "a,b", "APP_CACHE": '{"TIMEOUT": 10}'}
+        with mock.patch.dict(os.environ, environ):
+            appconf = AppConf()
+            assert appconf.workers == 4
+            assert appconf.hosts == ["a", "b"]
+            assert appconf.cache == {"timeout": 10}
+            assert appconf.get("cache.timeout") == 10
+            assert NoEnvironAppConf().workers == 1
+            AppConf.check()
+
+            # The project settings take precedence.
+            with override_settings(APP_WORKERS=8):
+                assert appconf.workers == 8
+
+            # Parsed once, until the string changes.
+            appconf.invalidate_cache()
+            with mock.patch.object(appsettings.IntegerSetting, "parse") as parse:
+                assert appconf.workers == 4
+                parse.assert_not_called()
+            os.environ["APP_WORKERS"] = "5"
+            appconf.invalidate_cache()
+            assert appconf.workers == 5
+
+            os.environ["APP_WORKERS"] = "many"
+            appconf.invalidate_cache()
+            with pytest.raises(ValueError, match="Environment variable APP_WORKERS has an invalid value"):
+                appconf.workers
+            with pytest.raises(ImproperlyConfigured):
+                AppConf.check()
+
+        appconf.invalidate_cache()
+        assert appconf.workers == 1
+
     def test_caching(self):
         class AppConf(appsettings.AppSettings):
             my_int = appsettings.IntegerSetting()
@@ -481,6 +886,21 @@ class AppSettingsTestCase(SimpleTestCase):
         with pytest.raises(AttributeError):
             assert not appconf.not_a_setting
 
+    def test_caching_instance_dict(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+
+        appconf = AppConf()
+        assert "my_int" not in appconf.__dict__
+        assert appconf.my_int == 0
+        # Warm reads are plain attribute lookups.
+        assert appconf.__dict__["my_int"] == 0
+        appconf.invalidate_cache()
+        assert "my_int" not in appconf.__dict__
+        with override_settings(MY_INT=1):
+            assert appconf.my_int == 1
+        assert appconf.my_int == 0
+
     def test_invalidate_on_signal(self):
         class AppConf(appsettings.AppSettings):
             my_int = appsettings.IntegerSetting()
@@ -500,6 +920,202 @@ class AppSettingsTestCase(SimpleTestCase):
         assert "my_int" not in appconf._cache
         assert appconf.my_int == 0
 
+    def test_invalidate_on_signal_selective(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            nested = appsettings.NestedSetting(settings=dict(inner=appsettings.IntegerSetting()))
+
+            class Meta:
+                setting_prefix = "prefix_"
+
+        assert AppConf._meta.names == {"PREFIX_MY_INT": ["my_int"], "PREFIX_NESTED": ["nested"]}
+        appconf = AppConf()
+        assert appconf.my_int == 0
+        assert appconf.nested == {}
+
+        with override_settings(UNRELATED=1):
+            assert appconf._cache == {"my_int": 0, "nested": {}}
+
+        with override_settings(PREFIX_NESTED={"INNER": 1}):
+            assert appconf._cache == {"my_int": 0}
+            assert appconf.nested == {"inner": 1}
+
+        assert appconf._cache == {"my_int": 0}
+        assert appconf.nested == {}
+
+    def test_invalidate_on_signal_callable_default(self):
+        from django.conf import settings
+
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            debug = appsettings.BooleanSetting(default=lambda: settings.DEBUG)
+            nested = appsettings.NestedSetting(
+                settings=dict(debug=appsettings.BooleanSetting(default=lambda: settings.DEBUG))
+            )
+
+        assert AppConf._meta.volatile == ["debug", "nested"]
+        appconf = AppConf()
+        with override_settings(NESTED={}):
+            assert appconf.my_int == 0
+            assert appconf.debug is False
+            assert appconf.get("nested.debug") is False
+
+            with override_settings(DEBUG=True):
+                assert appconf._cache == {"my_int": 0}
+                assert appconf.debug is True
+                assert appconf.get("nested.debug") is True
+
+            assert appconf.debug is False
+            assert appconf.get("nested.debug") is False
+
+    def test_concurrent_resolution(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def default():
+            calls.append(None)
+            started.set()
+            release.wait()
+            return 42
+
+        class AppConf(appsettings.AppSettings):
+            slow = appsettings.Setting(default=default)
+
+        appconf = AppConf()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(appconf.slow)) for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42] * 5
+        assert len(calls) == 1
+        assert appconf._cache == {"slow": 42}
+        assert appconf._pending == {}
+
+    def test_invalidate_during_resolution(self):
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.Setting(default=lambda: appconf.invalidate_cache() or 42)
+
+        appconf = AppConf()
+        # The value is returned, but not cached since it was invalidated meanwhile.
+        assert appconf.setting == 42
+        assert "setting" not in appconf._cache
+        assert "setting" not in appconf.__dict__
+
+    def test_preload(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            my_str = appsettings.StringSetting(default="foo")
+
+        appconf = AppConf()
+        timings = appconf.preload()
+        assert sorted(timings) == ["my_int", "my_str"]
+        assert all(timing >= 0 for timing in timings.values())
+        assert appconf._cache == {"my_int": 0, "my_str": "foo"}
+
+    def test_preload_check(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting(required=True)
+
+        appconf = AppConf()
+        with pytest.raises(ImproperlyConfigured):
+            appconf.preload(check=True)
+        assert appconf._cache == {}
+
+    def test_snapshot(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            my_str = appsettings.StringSetting(default="foo")
+
+        assert AppConf._meta.snapshot_class.__name__ == "AppConfSnapshot"
+        appconf = AppConf()
+        with override_settings(MY_INT=1):
+            snapshot = appconf.snapshot()
+        assert type(snapshot) is AppConf._meta.snapshot_class
+        assert snapshot.my_int == 1
+        assert snapshot.my_str == "foo"
+        assert appconf.my_int == 0
+        assert repr(snapshot) == "AppConfSnapshot(my_int=1, my_str='foo')"
+        assert not hasattr(snapshot, "__dict__")
+        with pytest.raises(AttributeError):
+            snapshot.my_int = 2
+        with pytest.raises(AttributeError):
+            del snapshot.my_int
+
+    def test_override(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            my_str = appsettings.StringSetting(default="foo")
+
+        appconf = AppConf()
+        assert appconf.my_int == 0
+        with appconf.override(my_int=1):
+            assert appconf.my_int == 1
+            assert appconf.my_str == "foo"
+            with appconf.override(my_str="bar"):
+                assert appconf.my_int == 1
+                assert appconf.my_str == "bar"
+            assert appconf.my_str == "foo"
+            # The shared cache is left untouched.
+            assert appconf._cache == {"my_int": 0, "my_str": "foo"}
+        assert appconf.my_int == 0
+        # Values are no longer written into the instance __dict__.
+        assert "my_int" not in appconf.__dict__
+
+        with pytest.raises(AttributeError):
+            with appconf.override(not_a_setting=1):
+                pass
+
+    def test_override_is_local(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+
+        appconf = AppConf()
+        entered = threading.Event()
+        leave = threading.Event()
+        results = []
+
+        def other_thread():
+            entered.wait()
+            results.append(appconf.my_int)
+            leave.set()
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        with appconf.override(my_int=1):
+            entered.set()
+            leave.wait()
+            assert appconf.my_int == 1
+        thread.join()
+        assert results == [0]
+
+    def test_override_copied_context(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+
+        appconf = AppConf()
+
+        async def main():
+            with appconf.override(my_int=5):
+                task = asyncio.ensure_future(read())
+            # An unrelated read, after the with block exits.
+            assert appconf.my_int == 0
+            return await task
+
+        async def read():
+            return appconf.my_int
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        assert loop.run_until_complete(main()) == 5
+        assert appconf.my_int == 0
+
     def test_check(self):
         assert appsettings.AppSettings.check() is None
 
@@ -512,3 +1128,83 @@ class AppSettingsTestCase(SimpleTestCase):
 
         with pytest.raises(ImproperlyConfigured):
             assert not AppConf.check()
+
+
+class RegistryTestCase(SimpleTestCase):
+    def test_registry(self):
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.Setting()
+
+        assert AppConf in _Metaclass.registered_classes()
+        assert appsettings.AppSettings not in _Metaclass.registered_classes()
+        assert list(AppConf._meta.instances) == []
+        appconf = AppConf()
+        assert list(AppConf._meta.instances) == [appconf]
+
+    def test_check_all(self):
+        class AppConf1(appsettings.AppSettings):
+            valid = appsettings.IntegerSetting()
+            invalid = appsettings.IntegerSetting(required=True)
+
+        class AppConf2(appsettings.AppSettings):
+            invalid = appsettings.StringSetting(name="setting")
+
+        assert appsettings.check_all([AppConf1]) == [
+            (AppConf1, "invalid", mock.ANY),
+        ]
+        with override_settings(SETTING=0):
+            errors = appsettings.check_all([AppConf1, AppConf2])
+        assert [(error.app_settings, error.name) for error in errors] == [(AppConf1, "invalid"), (AppConf2, "invalid")]
+        assert str(errors[0]).startswith("INVALID setting is required")
+        assert str(errors[1]).startswith("Setting SETTING has an invalid value")
+
+    def test_check_workers(self):
+        thread_names = set()
+
+        def validator(value):
+            thread_names.add(threading.current_thread().name)
+            if value < 0:
+                raise ValidationError("negative")
+
+        class AppConf(appsettings.AppSettings):
+            first = appsettings.IntegerSetting(default=-1, validators=[validator])
+            second = appsettings.IntegerSetting(default=1, validators=[validator])
+            third = appsettings.IntegerSetting(default=-1, validators=[validator])
+
+        with override_settings(FIRST=-1, SECOND=1, THIRD=-1):
+            sequential = appsettings.check_all([AppConf])
+            parallel = appsettings.check_all([AppConf], workers=2)
+            with pytest.raises(ImproperlyConfigured, match="Setting FIRST .*\nSetting THIRD "):
+                AppConf.check(workers=2)
+        assert [error.name for error in parallel] == [error.name for error in sequential] == ["first", "third"]
+        assert threading.current_thread().name in thread_names
+        assert len(thread_names) > 1
+
+    def test_system_check(self):
+        class AppConf(appsettings.AppSettings):
+            invalid = appsettings.IntegerSetting(name="invalid_setting_for_system_check", required=True)
+
+        errors = [error for error in check_settings() if error.obj == "AppConf.invalid"]
+        assert len(errors) == 1
+        assert errors[0].id == "appsettings.E001"
+        assert check_settings(app_configs=[]) == []
+
+
+class PackageTestCase(SimpleTestCase):
+    """Lazy package attributes tests."""
+
+    def test_lazy_import(self):
+        code = "import sys, appsettings; print(sorted(m for m in sys.modules if m.startswith('appsettings')))"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", code], env=env)
+        assert output.decode().strip() == "['appsettings']"
+
+    def test_public_names(self):
+        for name in appsettings.__all__:
+            assert getattr(appsettings, name) is not None
+        assert appsettings.Setting is appsettings.settings.Setting
+        assert appsettings.TypeChecker is appsettings.checkers.TypeChecker
+        assert set(appsettings.__all__) <= set(dir(appsettings))
+        with pytest.raises(AttributeError):
+            appsettings.no_such_name
+        assert hasattr(appsettings, "default_app_config") is (django.VERSION < (3, 2))
@@ -0,0 +1,192 @@
+"""Test the settings backends."""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import mock
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+import appsettings
+from appsettings import backends
+
+
+class BackendsTestCase(SimpleTestCase):
+    """Test the backends and their layering."""
+
+    def _write(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "w") as file:
+            file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_abstract_backends(self):
+        class NamesBackend(appsettings.Backend):
+            def load_names(self):
+                return ["APP_A"]
+
+        class IncompleteFileBackend(appsettings.FileBackend):
+            pass
+
+        with pytest.raises(TypeError, match="abstract"):
+            appsettings.Backend()
+        with pytest.raises(TypeError, match="get"):
+            NamesBackend()
+        with pytest.raises(TypeError, match="load"):
+            IncompleteFileBackend("settings.json")
+
+    def test_dict_backend(self):
+        backend = appsettings.DictBackend({"APP_A": 1})
+        assert backend.names == {"APP_A"}
+        assert backend.source("APP_A") is backend
+        with pytest.raises(KeyError):
+            backend.source("APP_B")
+        receiver = mock.Mock()
+        backends.backend_changed.connect(receiver, sender=backend)
+        self.addCleanup(backends.backend_changed.disconnect, receiver, sender=backend)
+        backend.set("APP_B", 2)
+        assert backend.names == {"APP_A", "APP_B"}
+        assert backend.generation == 1
+        receiver.assert_called_once_with(signal=backends.backend_changed, sender=backend, setting="APP_B")
+
+    def test_django_backend(self):
+        backend = appsettings.DjangoBackend()
+        assert "APP_A" not in backend.names
+        with override_settings(APP_A=1):
+            assert "APP_A" in backend.names
+            assert backend.get("APP_A") == 1
+        with pytest.raises(KeyError):
+            backend.get("APP_A")
+
+    def test_environ_backend(self):
+        backend = appsettings.EnvironBackend()
+        with mock.patch.dict(os.environ, {"APP_A": "1"}):
+            backend.changed()
+            assert backend.get("APP_A") == "1"
+            assert "APP_A" in backend.names
+
+    def test_file_backends(self):
+        backend = appsettings.JSONFileBackend(self._write(".json", json.dumps({"APP_A": 1, "APP_B": [2]})))
+        assert backend.get("APP_B") == [2]
+        with open(backend.path, "w") as file:
+            json.dump({"APP_A": 1, "APP_B": [3], "APP_C": 4}, file)
+        with mock.patch.object(backend, "changed") as changed:
+            backend.reload()
+        assert sorted(changed.call_args[0][0]) == ["APP_B", "APP_C"]
+        assert backend.get("APP_B") == [3]
+
+        backend = appsettings.TOMLFileBackend(self._write(".toml", 'APP_A = 1\n[APP_B]\nC = "d"\n'))
+        assert backend.get("APP_B") == {"C": "d"}
+
+        with mock.patch.dict(sys.modules, {"tomllib": None, "tomli": None}):
+            with pytest.raises(ImportError, match="tomli"):
+                appsettings.TOMLFileBackend("settings.toml")
+
+        with pytest.raises(ValueError):
+            appsettings.JSONFileBackend(self._write(".json", "[1]")).names
+
+    def test_layered_backend(self):
+        high = appsettings.DictBackend({"APP_A": 1})
+        low = appsettings.DictBackend({"APP_A": 2, "APP_B": 3})
+        backend = appsettings.LayeredBackend([high, low])
+        assert backend.index == {"APP_A": high, "APP_B": low}
+        assert backend.source("APP_B") is low
+        assert backend.get("APP_A") == 1
+
+        receiver = mock.Mock()
+        backends.backend_changed.connect(receiver, sender=backend)
+        self.addCleanup(backends.backend_changed.disconnect, receiver, sender=backend)
+        # Shadowed, nothing changes.
+        index = backend.index
+        low.set("APP_A", 4)
+        receiver.assert_not_called()
+        assert backend.index is index
+        high.delete("APP_A")
+        receiver.assert_called_once_with(signal=backends.backend_changed, sender=backend, setting="APP_A")
+        assert backend.get("APP_A") == 4
+
+    def test_app_settings_backends(self):
+        values = appsettings.DictBackend({"APP_WORKERS": 4, "APP_CACHE": {"TIMEOUT": 10}})
+        strings = appsettings.DictBackend({"APP_WORKERS": "5", "APP_HOSTS": "a,b"})
+        strings.strings = True
+
+        class AppConf(appsettings.AppSettings):
+            workers = appsettings.IntegerSetting(default=1)
+            hosts = appsettings.ListSetting()
+            cache = appsettings.NestedSetting(settings=dict(timeout=appsettings.IntegerSetting(default=300)))
+            other = appsettings.IntegerSetting(default=1)
+
+            class Meta:
+                setting_prefix = "app_"
+                backends = [appsettings.DjangoBackend(), values, strings]
+
+        appconf = AppConf()
+        assert appconf.workers == 4
+        assert appconf.hosts == ["a", "b"]
+        assert appconf.get("cache.timeout") == 10
+        assert appconf.other == 1
+        AppConf.check()
+
+        with override_settings(APP_WORKERS=8):
+            assert appconf.workers == 8
+        assert appconf.workers == 4
+
+        values.delete("APP_WORKERS")
+        assert appconf.workers == 5
+        assert appconf.hosts == ["a", "b"]
+        with mock.patch.object(appsettings.ListSetting, "parse") as parse:
+            appconf.invalidate_cache()
+            assert appconf.hosts == ["a", "b"]
+            parse.assert_not_called()
+
+        values.set("APP_CACHE", {"TIMEOUT": 20})
+        assert appconf.get("cache.timeout") == 20
+        strings.set("APP_WORKERS", "many")
+        with pytest.raises(ValueError, match="Setting APP_WORKERS has an invalid value"):
+            appconf.workers
+
+    def test_check_mutated_value(self):
+        value = {"TIMEOUT": 10}
+        backend = appsettings.DictBackend({"APP_CACHE": value})
+
+        class AppConf(appsettings.AppSettings):
+            cache = appsettings.DictSetting(value_type=int)
+
+            class Meta:
+                setting_prefix = "app_"
+                backends = [backend]
+
+        AppConf.check()
+        value["TIMEOUT"] = "10"
+        backend.set("APP_CACHE", value)
+        with pytest.raises(ImproperlyConfigured):
+            AppConf.check()
+
+    def test_default_backend(self):
+        backend = appsettings.DictBackend({"APP_WORKERS": 4})
+
+        class AppConf(appsettings.AppSettings):
+            workers = appsettings.IntegerSetting(default=1)
+
+            class Meta:
+                setting_prefix = "app_"
+
+        appconf = AppConf()
+        appsettings.set_default_backend(backend)
+        self.addCleanup(appsettings.set_default_backend, None)
+        assert appsettings.get_default_backend() is backend
+        assert appconf.workers == 4
+        backend.set("APP_WORKERS", 5)
+        assert appconf.workers == 5
+        appsettings.set_default_backend([backend, appsettings.DictBackend()])
+        assert isinstance(appsettings.get_default_backend(), appsettings.LayeredBackend)
+
+    def test_toml_not_imported(self):
+        code = "import sys; from appsettings import backends; print('tomllib' in sys.modules or 'tomli' in sys.modules)"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", code], env=env)
+        assert output.decode().strip() == "False"
@@ -0,0 +1,139 @@
+"""Test the import cache of object settings."""
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import mock
+import pytest
+from django.test import SimpleTestCase, override_settings
+
+import appsettings
+from appsettings import imports
+from appsettings.imports import import_object
+
+
+class ImportObjectTestCase(SimpleTestCase):
+    """Test import_object."""
+
+    def setUp(self):
+        appsettings.clear_import_cache()
+        self.addCleanup(appsettings.clear_import_cache)
+
+    def test_import_object(self):
+        assert import_object("appsettings.imports.import_object") is import_object
+        assert import_object("appsettings.imports") is imports
+        assert import_object("appsettings.imports.import_object.__name__") == "import_object"
+
+    def test_errors(self):
+        with pytest.raises(ImportError, match="No module named 'no_such_module'"):
+            import_object("no_such_module.attr")
+        with pytest.raises(AttributeError):
+            import_object("appsettings.imports.missing")
+        # Errors are not cached.
+        with pytest.raises(AttributeError):
+            import_object("appsettings.imports.missing")
+
+    def test_cache(self):
+        with mock.patch("appsettings.imports.find_spec", wraps=imports.find_spec) as find_spec:
+            with pytest.raises(AttributeError):
+                import_object("tests.no_such_module")
+            with pytest.raises(AttributeError):
+                import_object("tests.no_such_module.attr")
+            # Known non-module is not looked up again, modules in sys.modules are not looked up.
+            find_spec.assert_called_once_with("tests.no_such_module")
+        with mock.patch("appsettings.imports._import_module", wraps=imports._import_module) as import_module:
+            import_object("appsettings.imports.import_object")
+            import_object("appsettings.imports.import_object")
+            import_module.assert_called_once_with("appsettings.imports.import_object")
+
+    def test_find_modules(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.mkdir(os.path.join(directory, "lazy_package"))
+        files = {
+            "__init__.py": "value = 1\n",
+            "submodule.py": "value = 2\n",
+            "broken.py": "import appsettings_no_such_dependency\n",
+        }
+        for name, content in files.items():
+            with open(os.path.join(directory, "lazy_package", name), "w") as module_file:
+                module_file.write(content)
+        sys.path.insert(0, directory)
+        self.addCleanup(sys.path.remove, directory)
+        for name in ("lazy_package", "lazy_package.submodule", "lazy_package.broken"):
+            self.addCleanup(sys.modules.pop, name, None)
+
+        assert import_object("lazy_package.value") == 1
+        assert import_object("lazy_package.submodule").value == 2
+        with pytest.raises(ImportError, match="appsettings_no_such_dependency") as error:
+            import_object("lazy_package.broken.value")
+        # Original traceback, from the broken module.
+        assert str(error.traceback[-1].path).endswith("broken.py")
+
+    def test_submodule_shadowed_by_attribute(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.mkdir(os.path.join(directory, "shadow_package"))
+        with open(os.path.join(directory, "shadow_package", "__init__.py"), "w") as module_file:
+            module_file.write("def sub():\n    pass\n")
+        with open(os.path.join(directory, "shadow_package", "sub.py"), "w") as module_file:
+            module_file.write("X = 1\n")
+        sys.path.insert(0, directory)
+        self.addCleanup(sys.path.remove, directory)
+        for name in ("shadow_package", "shadow_package.sub"):
+            self.addCleanup(sys.modules.pop, name, None)
+
+        assert import_object("shadow_package.sub.X") == 1
+
+    def test_cache_module_changed(self):
+        import_object("appsettings.imports.import_object")
+        replacement = mock.Mock()
+        with mock.patch.dict(sys.modules, {"appsettings.imports": replacement}):
+            assert import_object("appsettings.imports.import_object") is replacement.import_object
+        assert import_object("appsettings.imports.import_object") is import_object
+
+    def test_cache_attribute_rebound(self):
+        assert import_object("json.dumps") is json.dumps
+        with mock.patch("json.dumps") as dumps:
+            assert import_object("json.dumps") is dumps
+
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.ObjectSetting(default="json.dumps", transform_default=True)
+
+        appconf = AppConf()
+        assert appconf.setting is json.dumps
+        with mock.patch("json.dumps") as dumps:
+            appconf.invalidate_cache()
+            assert appconf.setting is dumps
+
+    def test_not_modules_cleared(self):
+        with pytest.raises(AttributeError):
+            import_object("tests.no_such_module")
+        assert "tests.no_such_module" in imports._not_modules
+
+        with override_settings(UNRELATED=1):
+            assert not imports._not_modules
+
+        with pytest.raises(AttributeError):
+            import_object("tests.no_such_module")
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        sys.path.append(directory)
+        self.addCleanup(sys.path.remove, directory)
+        with mock.patch("appsettings.imports.find_spec", wraps=imports.find_spec) as find_spec:
+            with pytest.raises(AttributeError):
+                import_object("tests.no_such_module")
+            find_spec.assert_called_once_with("tests.no_such_module")
+
+    def test_lru(self):
+        with mock.patch.object(imports, "IMPORT_CACHE_SIZE", 2):
+            import_object("appsettings.imports.import_object")
+            import_object("appsettings.imports.clear_import_cache")
+            import_object("appsettings.imports.import_object")
+            import_object("appsettings.imports.IMPORT_CACHE_SIZE")
+            assert list(imports._objects) == [
+                "appsettings.imports.import_object",
+                "appsettings.imports.IMPORT_CACHE_SIZE",
+            ]
@@ -0,0 +1,68 @@
+"""Test the background prefetch of object settings."""
+import threading
+
+import mock
+from django.apps import apps
+from django.test import SimpleTestCase, override_settings
+
+import appsettings
+from appsettings import imports
+from appsettings.prefetch import prefetch_objects
+
+
+class PrefetchTestCase(SimpleTestCase):
+    """Test prefetch_objects."""
+
+    def setUp(self):
+        appsettings.clear_import_cache()
+        self.addCleanup(appsettings.clear_import_cache)
+
+    def test_prefetch(self):
+        class AppConf(appsettings.AppSettings):
+            setting = appsettings.ObjectSetting()
+            lazy = appsettings.ObjectSetting(lazy=True)
+            missing = appsettings.ObjectSetting(default="appsettings.no_such_name")
+            transformed = appsettings.ObjectSetting(default="appsettings.check_all", transform_default=True)
+            nested = appsettings.NestedSetting(settings=dict(inner=appsettings.ObjectSetting()))
+            integer = appsettings.IntegerSetting()
+
+        django_settings = {
+            "SETTING": "appsettings.imports.import_object",
+            "LAZY": "appsettings.no_such_object",
+            "NESTED": {"INNER": "appsettings.imports.LazyImport"},
+        }
+        with override_settings(**django_settings):
+            prefetcher = prefetch_objects([AppConf])
+            assert prefetcher.wait(5)
+        assert prefetcher.done
+        assert [(error.app_settings, error.name) for error in prefetcher.errors] == [(AppConf, "lazy")]
+        assert isinstance(prefetcher.errors[0].error, AttributeError)
+        assert set(imports._objects) == {
+            "appsettings.imports.import_object",
+            "appsettings.check_all",
+            "appsettings.imports.LazyImport",
+        }
+
+    def test_prefetch_after_apps_ready(self):
+        ready_event = threading.Event()
+        with mock.patch.object(apps, "ready_event", ready_event, create=True):
+            prefetcher = prefetch_objects()
+
+            # Defined by an application loaded after appsettings.
+            class AppConf(appsettings.AppSettings):
+                setting = appsettings.ObjectSetting(default="appsettings.check_all", transform_default=True)
+
+            assert not prefetcher.wait(0.1)
+            ready_event.set()
+            assert prefetcher.wait(5)
+        assert "appsettings.check_all" in imports._objects
+
+    def test_app_ready(self):
+        app_config = apps.get_app_config("appsettings")
+        with mock.patch("appsettings.prefetch.prefetch_objects") as prefetch:
+            app_config.ready()
+            prefetch.assert_not_called()
+            with override_settings(APPSETTINGS_PREFETCH_OBJECTS=True):
+                app_config.ready()
+        self.addCleanup(delattr, app_config, "prefetcher")
+        assert app_config.prefetcher is prefetch.return_value
@@ -0,0 +1,71 @@
+"""Test settings instrumentation."""
+from django.test import SimpleTestCase, override_settings
+
+import appsettings
+from appsettings.stats import Histogram
+
+
+class HistogramTestCase(SimpleTestCase):
+    """Test Histogram."""
+
+    def test_add(self):
+        histogram = Histogram()
+        assert histogram.mean is None
+        histogram.add(0.0000005)
+        histogram.add(0.000003)
+        histogram.add(0.000003)
+        assert histogram.count == 3
+        assert histogram.min == 0.0000005
+        assert histogram.max == 0.000003
+        assert histogram.buckets == {0: 1, 2: 2}
+
+
+class InMemoryStatsSinkTestCase(SimpleTestCase):
+    """Test InMemoryStatsSink with AppSettings."""
+
+    def setUp(self):
+        self.sink = appsettings.InMemoryStatsSink()
+        appsettings.set_stats_sink(self.sink)
+        self.addCleanup(appsettings.set_stats_sink, None)
+
+    def test_instrumentation(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+
+        appconf = AppConf()
+        assert appconf.my_int == 0
+        assert appconf.my_int == 0
+        assert "my_int" not in appconf.__dict__
+        with override_settings(MY_INT=1):
+            assert appconf.my_int == 1
+        AppConf.check()
+
+        assert self.sink.hits == {"AppConf.my_int": 1}
+        assert self.sink.misses == {"AppConf.my_int": 2}
+        assert self.sink.invalidations == {"AppConf.my_int": 2}
+        assert set(self.sink.timings) == {
+            ("get_value", "AppConf.my_int"),
+            ("transform", "AppConf.my_int"),
+            ("check", "AppConf.my_int"),
+        }
+        assert self.sink.timings[("get_value", "AppConf.my_int")].count == 2
+        assert self.sink.timings[("transform", "AppConf.my_int")].count == 1
+        assert self.sink.timings[("check", "AppConf.my_int")].count == 1
+
+        self.sink.reset()
+        assert not self.sink.hits
+
+    def test_set_sink_on_warm_instance(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+
+        appsettings.set_stats_sink(None)
+        appconf = AppConf()
+        assert appconf.my_int == 0
+        assert "my_int" in appconf.__dict__
+
+        appsettings.set_stats_sink(self.sink)
+        assert "my_int" not in appconf.__dict__
+        assert appconf.my_int == 0
+        assert self.sink.hits == {"AppConf.my_int": 1}
+        assert not self.sink.misses
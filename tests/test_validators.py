@@ -1,8 +1,18 @@
 """Test settings validators."""
+import array
+
+import mock
 from django.core.exceptions import ValidationError
 from django.test import SimpleTestCase
 
-from appsettings import DictKeysTypeValidator, DictValuesTypeValidator, TypeValidator, ValuesTypeValidator
+from appsettings import (
+    DictKeysTypeValidator,
+    DictValuesTypeValidator,
+    IterableValidator,
+    TypeValidator,
+    ValuesTypeValidator,
+    validators,
+)
 
 
 class TypeValidatorTestCase(SimpleTestCase):
@@ -17,6 +27,13 @@ class TypeValidatorTestCase(SimpleTestCase):
         with self.assertRaisesMessage(ValidationError, "Value None is not of type int."):
             TypeValidator(int)(None)
 
+    def test_custom_message(self):
+        validator = TypeValidator(int, message="Gimme %(type)s!")
+        assert validator.message == "Gimme %(type)s!"
+        assert not hasattr(validator, "__dict__")
+        with self.assertRaisesMessage(ValidationError, "Gimme int!"):
+            validator(None)
+
 
 class ValuesTypeValidatorTestCase(SimpleTestCase):
     """Test ValuesTypeValidator."""
@@ -30,6 +47,48 @@ class ValuesTypeValidatorTestCase(SimpleTestCase):
         with self.assertRaisesMessage(ValidationError, "Element None is not of type int."):
             ValuesTypeValidator(int)([42, None, 1676])
 
+    def test_bulk(self):
+        ValuesTypeValidator(int)([True, 42, 1676])
+        ValuesTypeValidator((int, str))(["a", 42])
+        ValuesTypeValidator(int)(array.array("l", [42, 14]))
+        ValuesTypeValidator(float)(array.array("d", [4.2, 1.4]))
+        ValuesTypeValidator(int)(iter([42, 14]))
+        with self.assertRaisesMessage(ValidationError, "Element 4.2 is not of type int."):
+            ValuesTypeValidator(int)(array.array("d", [4.2, 1.4]))
+        with self.assertRaisesMessage(ValidationError, "Element b is not of type int."):
+            ValuesTypeValidator(int)((42, "b"))
+
+    def test_bulk_large(self):
+        values = list(range(40))
+        ValuesTypeValidator(int)(values)
+        ValuesTypeValidator(int)(set(values))
+        ValuesTypeValidator((int, str))(values + ["a"])
+        with self.assertRaisesMessage(ValidationError, "Element b is not of type int."):
+            ValuesTypeValidator(int)(values[:35] + ["b"] + values[35:])
+        with self.assertRaisesMessage(ValidationError, "Element b is not of type int."):
+            ValuesTypeValidator(int)(tuple(values) + ("b",))
+
+    def test_bulk_dtype(self):
+        class Array(list):
+            # Duck-typed one-dimensional NumPy array.
+            ndim = 1
+
+            def __init__(self, values, item_type):
+                super(Array, self).__init__(values)
+                self.dtype = mock.Mock(type=item_type)
+
+        ValuesTypeValidator(int)(Array([1, 2], int))
+        # Elements are not iterated when the dtype matches.
+        ValuesTypeValidator(int)(Array(["a"], int))
+        with self.assertRaisesMessage(ValidationError, "Element 4.2 is not of type int."):
+            ValuesTypeValidator(int)(Array([4.2], float))
+
+    def test_bulk_array_unknown_typecode(self):
+        with mock.patch.object(validators, "_ARRAY_ITEM_TYPES", {}):
+            ValuesTypeValidator(int)(array.array("l", [42, 14]))
+            with self.assertRaisesMessage(ValidationError, "Element 42 is not of type str."):
+                ValuesTypeValidator(str)(array.array("l", [42, 14]))
+
 
 class DictKeysTypeValidatorTestCase(SimpleTestCase):
     """Test DictKeysTypeValidator."""
@@ -41,6 +100,13 @@ class DictKeysTypeValidatorTestCase(SimpleTestCase):
         with self.assertRaisesMessage(ValidationError, "The key None is not of type int."):
             DictKeysTypeValidator(int)({42: "a", None: "b"})
 
+    def test_bulk(self):
+        values = dict.fromkeys(range(40), "a")
+        DictKeysTypeValidator(int)(values)
+        values["b"] = "a"
+        with self.assertRaisesMessage(ValidationError, "The key b is not of type int."):
+            DictKeysTypeValidator(int)(values)
+
 
 class DictValuesTypeValidatorTestCase(SimpleTestCase):
     """Test DictValuesTypeValidator."""
@@ -51,3 +117,51 @@ class DictValuesTypeValidatorTestCase(SimpleTestCase):
     def test_invalid(self):
         with self.assertRaisesMessage(ValidationError, "Item b's value None is not of type int."):
             DictValuesTypeValidator(int)({"a": 42, "b": None})
+        with self.assertRaisesMessage(ValidationError, "Item b's value 4.2 is not of type int."):
+            DictValuesTypeValidator(int)({"a": 42, "b": 4.2})
+
+    def test_bulk(self):
+        values = dict(("key_%d" % index, index) for index in range(40))
+        DictValuesTypeValidator(int)(values)
+        values["b"] = None
+        with self.assertRaisesMessage(ValidationError, "Item b's value None is not of type int."):
+            DictValuesTypeValidator(int)(values)
+
+
+class IterableValidatorTestCase(SimpleTestCase):
+    """Test IterableValidator."""
+
+    def test_valid(self):
+        IterableValidator(int, min_length=1, max_length=3)([42, 14, 1676])
+        IterableValidator(int, min_length=1, max_length=3)(iter((42, 14, 1676)))
+        IterableValidator()([None])
+
+    def test_invalid(self):
+        validator = IterableValidator(int, min_length=2, max_length=3)
+        with self.assertRaisesMessage(ValidationError, "Element None is not of type int."):
+            validator([42, None, 1676])
+        with self.assertRaisesMessage(ValidationError, "Ensure this value has at least 2 characters (it has 1)."):
+            validator([42])
+        with self.assertRaisesMessage(ValidationError, "Ensure this value has at most 3 characters (it has 4)."):
+            validator([42, 14, 1676, 0])
+
+    def test_invalid_all_reported(self):
+        with self.assertRaises(ValidationError) as context:
+            IterableValidator(int, min_length=2)([None])
+        assert context.exception.messages == [
+            "Element None is not of type int.",
+            "Ensure this value has at least 2 characters (it has 1).",
+        ]
+
+    def test_iterator_single_pass(self):
+        consumed = []
+
+        def generator():
+            for element in range(10):
+                consumed.append(element)
+                yield element
+
+        with self.assertRaisesMessage(ValidationError, "Ensure this value has at most 3 elements (it has more)."):
+            IterableValidator(int, max_length=3)(generator())
+        # Iteration stopped once the maximum length was exceeded.
+        assert consumed == [0, 1, 2, 3]